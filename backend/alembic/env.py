@@ -12,8 +12,10 @@ from alembic import context
 import sys
 import os
 
-# Add the app directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+# Add the app directory to the Python path, once even if env.py is re-run
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
 
 from app.core.config import settings
 from app.core.database import Base
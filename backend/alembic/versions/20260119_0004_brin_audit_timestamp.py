@@ -0,0 +1,39 @@
+"""Use a BRIN index for audit log timestamps
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-01-19
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # BRIN is PostgreSQL-only; other dialects (MySQL in production) keep the
+    # existing B-tree rather than rebuilding an identical index
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # audit_logs is append-only, so timestamp follows physical row order
+    op.drop_index('idx_audit_timestamp', table_name='audit_logs')
+    op.create_index(
+        'idx_audit_timestamp',
+        'audit_logs',
+        ['timestamp'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('idx_audit_timestamp', table_name='audit_logs')
+    op.create_index('idx_audit_timestamp', 'audit_logs', ['timestamp'])
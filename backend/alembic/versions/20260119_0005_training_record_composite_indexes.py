@@ -0,0 +1,34 @@
+"""Add composite indexes for training record reports
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-01-19
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Reports, hours-by-type and record listings: org + status + completion range
+    op.create_index(
+        'idx_record_org_status_completion',
+        'training_records',
+        ['organization_id', 'status', 'completion_date']
+    )
+    # Expiring certifications: org + status + expiration range
+    op.create_index(
+        'idx_record_org_status_expiration',
+        'training_records',
+        ['organization_id', 'status', 'expiration_date']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_record_org_status_expiration', table_name='training_records')
+    op.drop_index('idx_record_org_status_completion', table_name='training_records')
@@ -0,0 +1,30 @@
+"""Add training record lookup indexes
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-01-19
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Requirement progress and user stats: user + status + completion range.
+    # Its (user_id, status) prefix serves every idx_record_user_status lookup.
+    op.create_index(
+        'idx_record_user_status_completion',
+        'training_records',
+        ['user_id', 'status', 'completion_date']
+    )
+    op.drop_index('idx_record_user_status', table_name='training_records')
+
+
+def downgrade() -> None:
+    op.create_index('idx_record_user_status', 'training_records', ['user_id', 'status'])
+    op.drop_index('idx_record_user_status_completion', table_name='training_records')
@@ -0,0 +1,27 @@
+"""Add organization + name index for the member roster
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-01-19
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Member list filters by organization and orders by last/first name
+    op.create_index(
+        'idx_user_org_name',
+        'users',
+        ['organization_id', 'last_name', 'first_name']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_user_org_name', table_name='users')
@@ -4,8 +4,8 @@ API Dependencies
 FastAPI dependencies for authentication, authorization, and database access.
 """
 
-from typing import Optional, List
-from fastapi import Depends, HTTPException, status, Header
+from typing import FrozenSet, Optional, List
+from fastapi import Depends, HTTPException, Request, status, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -16,56 +16,6 @@ from app.models.user import User, Organization, Role
 from app.services.auth_service import AuthService
 
 
-class PermissionChecker:
-    """
-    Dependency class for checking user permissions
-
-    Usage:
-        @app.get("/admin")
-        async def admin_route(
-            current_user: User = Depends(require_permission("admin.access"))
-        ):
-            ...
-    """
-
-    def __init__(self, required_permissions: List[str]):
-        self.required_permissions = required_permissions
-
-    async def __call__(
-        self,
-        current_user: User = Depends(lambda: get_current_user()),
-    ) -> User:
-        """Check if user has required permissions"""
-        # Get user's permissions from all their roles
-        user_permissions = []
-        for role in current_user.roles:
-            user_permissions.extend(role.permissions or [])
-
-        # Check if user has any of the required permissions
-        for perm in self.required_permissions:
-            if perm in user_permissions:
-                return current_user
-
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions"
-        )
-
-
-def require_permission(*permissions: str):
-    """
-    Create a permission checker dependency
-
-    Usage:
-        @app.get("/settings")
-        async def update_settings(
-            user: User = Depends(require_permission("settings.edit"))
-        ):
-            ...
-    """
-    return PermissionChecker(list(permissions))
-
-
 async def get_current_user(
     authorization: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db),
@@ -115,6 +65,73 @@ async def get_current_active_user(
     return current_user
 
 
+def get_user_permissions(request: Request, user: User) -> FrozenSet[str]:
+    """
+    Get the union of the user's role permissions
+
+    Computed once per request and kept on request.state, so endpoints
+    guarded by several permission checks only walk the roles once.
+    """
+    permissions = getattr(request.state, "user_permissions", None)
+    if permissions is None:
+        permissions = frozenset(
+            permission
+            for role in user.roles
+            for permission in (role.permissions or [])
+        )
+        request.state.user_permissions = permissions
+    return permissions
+
+
+class PermissionChecker:
+    """
+    Dependency class for checking user permissions
+
+    Usage:
+        @app.get("/admin")
+        async def admin_route(
+            current_user: User = Depends(require_permission("admin.access"))
+        ):
+            ...
+    """
+
+    def __init__(self, required_permissions: List[str]):
+        # Stored as a set so the check is a single set intersection
+        self.required_permissions = frozenset(required_permissions)
+
+    async def __call__(
+        self,
+        request: Request,
+        current_user: User = Depends(get_current_user),
+    ) -> User:
+        """Check if user has required permissions"""
+        # Get user's permissions from all their roles
+        user_permissions = get_user_permissions(request, current_user)
+
+        # Check if user has any of the required permissions
+        if not self.required_permissions.isdisjoint(user_permissions):
+            return current_user
+
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions"
+        )
+
+
+def require_permission(*permissions: str):
+    """
+    Create a permission checker dependency
+
+    Usage:
+        @app.get("/settings")
+        async def update_settings(
+            user: User = Depends(require_permission("settings.edit"))
+        ):
+            ...
+    """
+    return PermissionChecker(list(permissions))
+
+
 async def get_user_organization(
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
@@ -20,7 +20,7 @@ from app.schemas.auth import (
 from app.services.auth_service import AuthService
 from app.api.dependencies import get_current_user, get_current_active_user
 from app.models.user import User
-from app.core.config import settings
+from app.core.config import settings, TEST_ORG_ID
 
 
 router = APIRouter()
@@ -43,11 +43,6 @@ async def register(
     """
     auth_service = AuthService(db)
 
-    # TODO: Get organization_id from registration context
-    # For now, use the test organization
-    from uuid import UUID as UUIDType
-    test_org_id = UUIDType("00000000-0000-0000-0000-000000000001")
-
     # Register user
     user, error = await auth_service.register_user(
         username=user_data.username,
@@ -55,7 +50,7 @@ async def register(
         password=user_data.password,
         first_name=user_data.first_name,
         last_name=user_data.last_name,
-        organization_id=test_org_id,
+        organization_id=TEST_ORG_ID,
         badge_number=user_data.badge_number,
     )
 
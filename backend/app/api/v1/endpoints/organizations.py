@@ -7,6 +7,7 @@ Endpoints for organization settings management.
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import TEST_ORG_ID
 from app.core.database import get_db
 from app.schemas.organization import (
     OrganizationSettingsResponse,
@@ -36,12 +37,8 @@ async def get_organization_settings(
 
     **Authentication required** (currently not implemented)
     """
-    # TODO: Remove this once authentication is implemented
-    from uuid import UUID
-    test_org_id = UUID("00000000-0000-0000-0000-000000000001")
-
     org_service = OrganizationService(db)
-    settings = await org_service.get_organization_settings(test_org_id)
+    settings = await org_service.get_organization_settings(TEST_ORG_ID)
 
     return settings
 
@@ -66,10 +63,6 @@ async def update_organization_settings(
 
     **Authentication and secretary role required** (currently not implemented)
     """
-    # TODO: Remove this once authentication is implemented
-    from uuid import UUID
-    test_org_id = UUID("00000000-0000-0000-0000-000000000001")
-
     org_service = OrganizationService(db)
 
     # Convert Pydantic model to dict for updating
@@ -88,7 +81,7 @@ async def update_organization_settings(
     # Update settings
     try:
         updated_settings = await org_service.update_organization_settings(
-            test_org_id,
+            TEST_ORG_ID,
             settings_dict
         )
         return updated_settings
@@ -115,10 +108,6 @@ async def update_contact_info_settings(
 
     **Authentication and secretary role required** (currently not implemented)
     """
-    # TODO: Remove this once authentication is implemented
-    from uuid import UUID
-    test_org_id = UUID("00000000-0000-0000-0000-000000000001")
-
     org_service = OrganizationService(db)
 
     # Update just the contact info visibility settings
@@ -132,7 +121,7 @@ async def update_contact_info_settings(
     }
 
     try:
-        await org_service.update_organization_settings(test_org_id, settings_dict)
+        await org_service.update_organization_settings(TEST_ORG_ID, settings_dict)
         return contact_settings
     except ValueError as e:
         raise HTTPException(
@@ -5,12 +5,16 @@ Endpoints for role management and permissions.
 """
 
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+import json
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from app.core.config import TEST_ORG_ID
+from app.core.cache import cache_manager, roles_cache_key
 from app.core.database import get_db
 from app.schemas.role import (
     RoleResponse,
@@ -24,7 +28,6 @@ from app.schemas.role import (
 from app.models.user import Role, User
 from app.core.permissions import (
     get_permission_details,
-    get_permissions_by_category,
     get_admin_role_slugs,
 )
 # NOTE: Authentication is not yet implemented
@@ -35,40 +38,77 @@ from app.core.permissions import (
 router = APIRouter()
 
 
+# Role lists back the role pickers in the UI and rarely change; mutations
+# below drop the cached copy so the TTL only bounds out-of-band edits
+ROLES_CACHE_TTL = 300
+
+
+def _build_permissions_by_category_response() -> List[dict]:
+    """Group the serialized permission details by category"""
+    categorized = {}
+    for detail in get_permission_details():
+        categorized.setdefault(detail["category"], []).append(detail)
+    return [
+        {"category": category, "permissions": permissions}
+        for category, permissions in categorized.items()
+    ]
+
+
+# The permission catalog is static, so the response payload is built once
+PERMISSIONS_BY_CATEGORY_RESPONSE = _build_permissions_by_category_response()
+
+
+def _etag_for(payload: List[dict]) -> str:
+    """Strong ETag for a static JSON payload"""
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _client_has_current(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names this ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+# The catalog only changes on deploy, so clients can revalidate with a 304
+PERMISSIONS_ETAG = _etag_for(get_permission_details())
+PERMISSIONS_BY_CATEGORY_ETAG = _etag_for(PERMISSIONS_BY_CATEGORY_RESPONSE)
+
+
 @router.get("/permissions", response_model=List[PermissionDetail])
-async def list_permissions():
+async def list_permissions(request: Request, response: Response):
     """
     Get list of all available permissions
 
     Returns permission details grouped by category for display in the UI.
+    Supports If-None-Match revalidation.
     """
+    if _client_has_current(request, PERMISSIONS_ETAG):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": PERMISSIONS_ETAG})
+
+    response.headers["ETag"] = PERMISSIONS_ETAG
     return get_permission_details()
 
 
 @router.get("/permissions/by-category", response_model=List[PermissionCategory])
-async def list_permissions_by_category():
+async def list_permissions_by_category(request: Request, response: Response):
     """
     Get permissions organized by category
 
     Useful for building permission selection UI with category grouping.
+    Supports If-None-Match revalidation.
     """
-    categorized = get_permissions_by_category()
-
-    result = []
-    for category, permissions in categorized.items():
-        result.append({
-            "category": category,
-            "permissions": [
-                {
-                    "name": p.name,
-                    "description": p.description,
-                    "category": p.category.value
-                }
-                for p in permissions
-            ]
-        })
+    if _client_has_current(request, PERMISSIONS_BY_CATEGORY_ETAG):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": PERMISSIONS_BY_CATEGORY_ETAG}
+        )
 
-    return result
+    response.headers["ETag"] = PERMISSIONS_BY_CATEGORY_ETAG
+    return PERMISSIONS_BY_CATEGORY_RESPONSE
 
 
 @router.get("/", response_model=List[RoleResponse])
@@ -82,19 +122,24 @@ async def list_roles(
     Get all roles for the organization
 
     Returns all roles including system roles and custom roles.
+    The list is cached in Redis and dropped on any role change.
     """
-    # TODO: Use authenticated organization ID
-    from uuid import UUID as UUIDType
-    test_org_id = UUIDType("00000000-0000-0000-0000-000000000001")
-
-    result = await db.execute(
-        select(Role)
-        .where(Role.organization_id == test_org_id)
-        .order_by(Role.priority.desc(), Role.name)
+    async def load_roles() -> List[dict]:
+        result = await db.execute(
+            select(Role)
+            .where(Role.organization_id == TEST_ORG_ID)
+            .order_by(Role.priority.desc(), Role.name)
+        )
+        return [
+            RoleResponse.model_validate(role).model_dump(mode="json")
+            for role in result.scalars().all()
+        ]
+
+    return await cache_manager.get_or_set(
+        roles_cache_key(TEST_ORG_ID),
+        load_roles,
+        ttl=ROLES_CACHE_TTL,
     )
-    roles = result.scalars().all()
-
-    return roles
 
 
 @router.post("/", response_model=RoleResponse, status_code=status.HTTP_201_CREATED)
@@ -111,14 +156,10 @@ async def create_role(
     Requires `roles.create` permission.
     System roles cannot be created through this endpoint.
     """
-    # TODO: Use authenticated organization ID
-    from uuid import UUID as UUIDType, uuid4
-    test_org_id = UUIDType("00000000-0000-0000-0000-000000000001")
-
     # Check if slug already exists
     result = await db.execute(
         select(Role).where(
-            Role.organization_id == test_org_id,
+            Role.organization_id == TEST_ORG_ID,
             Role.slug == role_data.slug
         )
     )
@@ -131,7 +172,7 @@ async def create_role(
     # Create role
     role = Role(
         id=uuid4(),
-        organization_id=test_org_id,
+        organization_id=TEST_ORG_ID,
         name=role_data.name,
         slug=role_data.slug,
         description=role_data.description,
@@ -143,6 +184,7 @@ async def create_role(
     db.add(role)
     await db.commit()
     await db.refresh(role)
+    await cache_manager.delete(roles_cache_key(TEST_ORG_ID))
 
     return role
 
@@ -155,14 +197,10 @@ async def get_role(
     # organization: Organization = Depends(get_user_organization),
 ):
     """Get a specific role by ID"""
-    # TODO: Use authenticated organization ID
-    from uuid import UUID as UUIDType
-    test_org_id = UUIDType("00000000-0000-0000-0000-000000000001")
-
     result = await db.execute(
         select(Role).where(
             Role.id == role_id,
-            Role.organization_id == test_org_id
+            Role.organization_id == TEST_ORG_ID
         )
     )
     role = result.scalar_one_or_none()
@@ -191,14 +229,10 @@ async def update_role(
     Requires `roles.edit` permission.
     System roles can have their permissions updated, but name/slug cannot be changed.
     """
-    # TODO: Use authenticated organization ID
-    from uuid import UUID as UUIDType
-    test_org_id = UUIDType("00000000-0000-0000-0000-000000000001")
-
     result = await db.execute(
         select(Role).where(
             Role.id == role_id,
-            Role.organization_id == test_org_id
+            Role.organization_id == TEST_ORG_ID
         )
     )
     role = result.scalar_one_or_none()
@@ -224,6 +258,7 @@ async def update_role(
 
     await db.commit()
     await db.refresh(role)
+    await cache_manager.delete(roles_cache_key(TEST_ORG_ID))
 
     return role
 
@@ -242,14 +277,10 @@ async def delete_role(
     Requires `roles.delete` permission.
     System roles cannot be deleted.
     """
-    # TODO: Use authenticated organization ID
-    from uuid import UUID as UUIDType
-    test_org_id = UUIDType("00000000-0000-0000-0000-000000000001")
-
     result = await db.execute(
         select(Role).where(
             Role.id == role_id,
-            Role.organization_id == test_org_id
+            Role.organization_id == TEST_ORG_ID
         )
     )
     role = result.scalar_one_or_none()
@@ -268,6 +299,7 @@ async def delete_role(
 
     await db.delete(role)
     await db.commit()
+    await cache_manager.delete(roles_cache_key(TEST_ORG_ID))
 
 
 @router.get("/admin-access/check")
@@ -166,12 +166,17 @@ async def list_records(
     status: Optional[str] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Maximum number of records to return"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     List training records
 
+    Pass `limit` (and optionally `skip`) to page through long training
+    histories; without it every matching record is returned.
+
     **Authentication required**
     """
     query = select(TrainingRecord).where(
@@ -190,7 +195,12 @@ async def list_records(
     if end_date:
         query = query.where(TrainingRecord.completion_date <= end_date)
 
-    query = query.order_by(TrainingRecord.completion_date.desc())
+    # id breaks ties so pages stay stable across requests
+    query = query.order_by(TrainingRecord.completion_date.desc(), TrainingRecord.id)
+    if skip:
+        query = query.offset(skip)
+    if limit is not None:
+        query = query.limit(limit)
 
     result = await db.execute(query)
     return result.scalars().all()
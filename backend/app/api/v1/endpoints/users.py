@@ -4,13 +4,14 @@ Users API Endpoints
 Endpoints for user management and listing.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from uuid import UUID
 
+from app.core.config import TEST_ORG_ID
 from app.core.database import get_db
 from app.schemas.user import (
     UserListResponse,
@@ -21,7 +22,7 @@ from app.schemas.user import (
 from app.schemas.role import UserRoleAssignment, UserRoleResponse
 from app.services.user_service import UserService
 from app.services.organization_service import OrganizationService
-from app.models.user import User, Role, user_roles
+from app.models.user import User, Role
 from app.api.dependencies import get_current_user
 # NOTE: Authentication is now implemented
 # from app.api.dependencies import get_current_active_user, get_user_organization
@@ -33,6 +34,8 @@ router = APIRouter()
 
 @router.get("/", response_model=List[UserListResponse])
 async def list_users(
+    skip: int = Query(0, ge=0, description="Number of members to skip"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Maximum number of members to return"),
     db: AsyncSession = Depends(get_db),
     # Uncomment when authentication is implemented:
     # current_user: User = Depends(get_current_active_user),
@@ -49,26 +52,23 @@ async def list_users(
     stating that it is for department purposes only and should not be used
     for commercial purposes.
 
+    Pass `limit` (and optionally `skip`) to page through large rosters;
+    without it the full list is returned.
+
     **Authentication required** (currently not implemented)
     """
-    # TODO: Remove this once authentication is implemented
-    # For now, we'll use a hardcoded organization ID for testing
-    # In production, this would come from the authenticated user
-    from uuid import UUID
-    test_org_id = UUID("00000000-0000-0000-0000-000000000001")
-
     user_service = UserService(db)
     org_service = OrganizationService(db)
 
     # Get organization settings
-    settings = await org_service.get_organization_settings(test_org_id)
+    settings = await org_service.get_organization_settings(TEST_ORG_ID)
 
     # Check if contact info visibility is enabled
     include_contact_info = settings.contact_info_visibility.enabled
 
     # Get users with conditional contact info
     users = await user_service.get_users_for_organization(
-        organization_id=test_org_id,
+        organization_id=TEST_ORG_ID,
         include_contact_info=include_contact_info,
         contact_settings={
             "contact_info_visibility": {
@@ -76,7 +76,9 @@ async def list_users(
                 "show_phone": settings.contact_info_visibility.show_phone,
                 "show_mobile": settings.contact_info_visibility.show_mobile,
             }
-        }
+        },
+        skip=skip,
+        limit=limit,
     )
 
     return users
@@ -96,12 +98,8 @@ async def check_contact_info_enabled(
 
     **Authentication required** (currently not implemented)
     """
-    # TODO: Remove this once authentication is implemented
-    from uuid import UUID
-    test_org_id = UUID("00000000-0000-0000-0000-000000000001")
-
     org_service = OrganizationService(db)
-    settings = await org_service.get_organization_settings(test_org_id)
+    settings = await org_service.get_organization_settings(TEST_ORG_ID)
 
     return {
         "enabled": settings.contact_info_visibility.enabled,
@@ -126,13 +124,9 @@ async def list_users_with_roles(
 
     **Authentication required** (currently not implemented)
     """
-    # TODO: Use authenticated organization ID
-    from uuid import UUID as UUIDType
-    test_org_id = UUIDType("00000000-0000-0000-0000-000000000001")
-
     result = await db.execute(
         select(User)
-        .where(User.organization_id == test_org_id)
+        .where(User.organization_id == TEST_ORG_ID)
         .where(User.deleted_at.is_(None))
         .options(selectinload(User.roles))
         .order_by(User.last_name, User.first_name)
@@ -154,14 +148,10 @@ async def get_user_roles(
 
     **Authentication required** (currently not implemented)
     """
-    # TODO: Use authenticated organization ID
-    from uuid import UUID as UUIDType
-    test_org_id = UUIDType("00000000-0000-0000-0000-000000000001")
-
     result = await db.execute(
         select(User)
         .where(User.id == user_id)
-        .where(User.organization_id == test_org_id)
+        .where(User.organization_id == TEST_ORG_ID)
         .where(User.deleted_at.is_(None))
         .options(selectinload(User.roles))
     )
@@ -197,15 +187,11 @@ async def assign_user_roles(
 
     **Authentication required** (currently not implemented)
     """
-    # TODO: Use authenticated organization ID
-    from uuid import UUID as UUIDType
-    test_org_id = UUIDType("00000000-0000-0000-0000-000000000001")
-
     # Get user
     result = await db.execute(
         select(User)
         .where(User.id == user_id)
-        .where(User.organization_id == test_org_id)
+        .where(User.organization_id == TEST_ORG_ID)
         .where(User.deleted_at.is_(None))
         .options(selectinload(User.roles))
     )
@@ -222,7 +208,7 @@ async def assign_user_roles(
         result = await db.execute(
             select(Role)
             .where(Role.id.in_(role_assignment.role_ids))
-            .where(Role.organization_id == test_org_id)
+            .where(Role.organization_id == TEST_ORG_ID)
         )
         roles = result.scalars().all()
 
@@ -234,16 +220,13 @@ async def assign_user_roles(
     else:
         roles = []
 
-    # Remove all existing role assignments
-    await db.execute(
-        delete(user_roles).where(user_roles.c.user_id == user_id)
-    )
-
-    # Assign new roles
+    # Replace assignments; the ORM diffs the loaded collection and only
+    # deletes/inserts the user_roles rows that actually change
     user.roles = roles
     await db.commit()
-    await db.refresh(user)
 
+    # user.roles is already loaded and current; refreshing would expire it
+    # and force a lazy reload while building the response
     return {
         "user_id": user.id,
         "username": user.username,
@@ -268,15 +251,11 @@ async def add_role_to_user(
 
     **Authentication required** (currently not implemented)
     """
-    # TODO: Use authenticated organization ID
-    from uuid import UUID as UUIDType
-    test_org_id = UUIDType("00000000-0000-0000-0000-000000000001")
-
     # Get user
     result = await db.execute(
         select(User)
         .where(User.id == user_id)
-        .where(User.organization_id == test_org_id)
+        .where(User.organization_id == TEST_ORG_ID)
         .where(User.deleted_at.is_(None))
         .options(selectinload(User.roles))
     )
@@ -292,7 +271,7 @@ async def add_role_to_user(
     result = await db.execute(
         select(Role)
         .where(Role.id == role_id)
-        .where(Role.organization_id == test_org_id)
+        .where(Role.organization_id == TEST_ORG_ID)
     )
     role = result.scalar_one_or_none()
 
@@ -312,8 +291,9 @@ async def add_role_to_user(
     # Add role
     user.roles.append(role)
     await db.commit()
-    await db.refresh(user)
 
+    # user.roles is already loaded and current; refreshing would expire it
+    # and force a lazy reload while building the response
     return {
         "user_id": user.id,
         "username": user.username,
@@ -338,15 +318,11 @@ async def remove_role_from_user(
 
     **Authentication required** (currently not implemented)
     """
-    # TODO: Use authenticated organization ID
-    from uuid import UUID as UUIDType
-    test_org_id = UUIDType("00000000-0000-0000-0000-000000000001")
-
     # Get user
     result = await db.execute(
         select(User)
         .where(User.id == user_id)
-        .where(User.organization_id == test_org_id)
+        .where(User.organization_id == TEST_ORG_ID)
         .where(User.deleted_at.is_(None))
         .options(selectinload(User.roles))
     )
@@ -373,8 +349,9 @@ async def remove_role_from_user(
 
     user.roles.remove(role_to_remove)
     await db.commit()
-    await db.refresh(user)
 
+    # user.roles is already loaded and current; refreshing would expire it
+    # and force a lazy reload while building the response
     return {
         "user_id": user.id,
         "username": user.username,
@@ -438,20 +415,9 @@ async def update_contact_info(
             detail="You can only update your own contact information"
         )
 
-    result = await db.execute(
-        select(User)
-        .where(User.id == user_id)
-        .where(User.organization_id == current_user.organization_id)
-        .where(User.deleted_at.is_(None))
-        .options(selectinload(User.roles))
-    )
-    user = result.scalar_one_or_none()
-
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
+    # current_user was loaded (active, not deleted) by get_current_user in
+    # this same request session, so there is no need to select it again
+    user = current_user
 
     # Update fields if provided
     if contact_update.email is not None:
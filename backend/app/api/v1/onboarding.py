@@ -17,6 +17,13 @@ from app.models.onboarding import OnboardingStatus, OnboardingChecklistItem
 
 router = APIRouter(prefix="/onboarding", tags=["onboarding"])
 
+# Validation patterns and choices, compiled once at import
+SLUG_PATTERN = re.compile(r'^[a-z0-9-_]+$')
+USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+VALID_ORGANIZATION_TYPES = ('fire_department', 'ems', 'hospital', 'clinic', 'emergency_services')
+_VALID_ORGANIZATION_TYPE_SET = frozenset(VALID_ORGANIZATION_TYPES)
+_ORGANIZATION_TYPE_ERROR = f'Organization type must be one of: {", ".join(VALID_ORGANIZATION_TYPES)}'
+
 
 # ============================================
 # Request/Response Models
@@ -54,15 +61,14 @@ class OrganizationCreate(BaseModel):
 
     @validator('slug')
     def validate_slug(cls, v):
-        if not re.match(r'^[a-z0-9-_]+$', v):
+        if not SLUG_PATTERN.match(v):
             raise ValueError('Slug must contain only lowercase letters, numbers, hyphens, and underscores')
         return v
 
     @validator('organization_type')
     def validate_org_type(cls, v):
-        valid_types = ['fire_department', 'ems', 'hospital', 'clinic', 'emergency_services']
-        if v not in valid_types:
-            raise ValueError(f'Organization type must be one of: {", ".join(valid_types)}')
+        if v not in _VALID_ORGANIZATION_TYPE_SET:
+            raise ValueError(_ORGANIZATION_TYPE_ERROR)
         return v
 
 
@@ -97,7 +103,7 @@ class AdminUserCreate(BaseModel):
 
     @validator('username')
     def validate_username(cls, v):
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not USERNAME_PATTERN.match(v):
             raise ValueError('Username can only contain letters, numbers, hyphens, and underscores')
         return v
 
@@ -195,8 +201,15 @@ async def get_onboarding_status(
     """
     service = OnboardingService(db)
 
-    needs_onboarding = await service.needs_onboarding()
+    # The status row answers everything once it exists; only fall back to
+    # the needs_onboarding checks (and their legacy auto-complete) without it
     status = await service.get_onboarding_status()
+    needs_onboarding = True
+    if not status:
+        needs_onboarding = await service.needs_onboarding()
+        if not needs_onboarding:
+            # Legacy installs get a completed status row created on the fly
+            status = await service.get_onboarding_status()
 
     if status:
         return OnboardingStatusResponse(
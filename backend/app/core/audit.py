@@ -22,6 +22,9 @@ class AuditLogger:
     Tamper-proof audit logger with cryptographic hash chains
     """
     
+    # Rows fetched per round-trip when walking the chain or checkpointing
+    VERIFY_BATCH_SIZE = 1000
+    
     @staticmethod
     def calculate_hash(log_data: Dict[str, Any], previous_hash: str) -> str:
         """
@@ -68,14 +71,16 @@ class AuditLogger:
         - Current entry's hash (calculated from all data + previous hash)
         """
         try:
-            # Get the last log entry to get previous hash
+            # Get the previous hash from the last log entry; only the hash
+            # column is needed, so skip loading the full row (event_data,
+            # user_agent, geo_location)
             result = await db.execute(
-                select(AuditLog)
+                select(AuditLog.current_hash)
                 .order_by(AuditLog.id.desc())
                 .limit(1)
             )
-            last_log = result.scalar_one_or_none()
-            previous_hash = last_log.current_hash if last_log else "0" * 64
+            last_hash = result.scalar_one_or_none()
+            previous_hash = last_hash if last_hash else "0" * 64
             
             # Create log entry data
             timestamp = datetime.utcnow()
@@ -120,7 +125,7 @@ class AuditLogger:
             return log_entry
             
         except Exception as e:
-            logger.error(f"Failed to create audit log: {e}")
+            logger.error("Failed to create audit log: {}", e)
             await db.rollback()
             raise
     
@@ -139,36 +144,47 @@ class AuditLogger:
             - total_checked: int - number of entries checked
             - errors: List - any integrity violations found
         """
-        # Build query
-        query = select(AuditLog).order_by(AuditLog.id)
+        # Build query; select only the columns that feed the hash and the
+        # chain check, as plain rows rather than ORM entities
+        query = select(
+            AuditLog.id,
+            AuditLog.timestamp,
+            AuditLog.timestamp_nanos,
+            AuditLog.event_type,
+            AuditLog.user_id,
+            AuditLog.ip_address,
+            AuditLog.event_data,
+            AuditLog.previous_hash,
+            AuditLog.current_hash,
+        ).order_by(AuditLog.id)
         
         if start_id:
             query = query.where(AuditLog.id >= start_id)
         if end_id:
             query = query.where(AuditLog.id <= end_id)
         
-        result = await db.execute(query)
-        logs = result.scalars().all()
-        
-        if not logs:
-            return {
-                "verified": True,
-                "total_checked": 0,
-                "first_id": None,
-                "last_id": None,
-                "errors": [],
-            }
-        
         results = {
             "verified": True,
-            "total_checked": len(logs),
-            "first_id": logs[0].id,
-            "last_id": logs[-1].id,
+            "total_checked": 0,
+            "first_id": None,
+            "last_id": None,
             "errors": [],
         }
         
+        # Stream the chain in batches instead of loading every entry into
+        # memory; only the previous entry's hash is needed to check links
+        previous_log_hash = None
+        stream = await db.stream(
+            query.execution_options(yield_per=self.VERIFY_BATCH_SIZE)
+        )
+        
         # Verify each log entry
-        for i, log in enumerate(logs):
+        async for log in stream:
+            if results["first_id"] is None:
+                results["first_id"] = log.id
+            results["last_id"] = log.id
+            results["total_checked"] += 1
+            
             # Recalculate hash
             log_data = {
                 "timestamp": log.timestamp.isoformat(),
@@ -192,16 +208,27 @@ class AuditLogger:
                 })
             
             # Check chain integrity (except for first entry)
-            if i > 0:
-                previous_log = logs[i - 1]
-                if log.previous_hash != previous_log.current_hash:
+            if previous_log_hash is not None:
+                if log.previous_hash != previous_log_hash:
                     results["verified"] = False
                     results["errors"].append({
                         "log_id": log.id,
                         "error": "Chain broken - previous hash does not match",
                         "expected_previous": log.previous_hash,
-                        "actual_previous": previous_log.current_hash,
+                        "actual_previous": previous_log_hash,
                     })
+            
+            previous_log_hash = log.current_hash
+        
+        # Raise a single alert for the whole run rather than one per entry
+        if not results["verified"]:
+            failed_ids = sorted({error["log_id"] for error in results["errors"]})
+            logger.critical(
+                "Audit log integrity check failed: {} tampered entries out of {} checked, ids={}",
+                len(failed_ids),
+                results["total_checked"],
+                failed_ids,
+            )
         
         return results
     
@@ -217,31 +244,37 @@ class AuditLogger:
         This provides a cryptographic snapshot that can be used
         to verify integrity of historical logs.
         """
-        # Get all logs in range
-        result = await db.execute(
-            select(AuditLog)
+        # Calculate Merkle root (simplified - hash of all hashes) in a single
+        # pass over just the hash column; feeding the digest incrementally
+        # gives the same result as hashing the concatenated string
+        stream = await db.stream_scalars(
+            select(AuditLog.current_hash)
             .where(AuditLog.id >= first_log_id)
             .where(AuditLog.id <= last_log_id)
             .order_by(AuditLog.id)
+            .execution_options(yield_per=self.VERIFY_BATCH_SIZE)
         )
-        logs = result.scalars().all()
         
-        if not logs:
+        merkle = hashlib.sha256()
+        total_entries = 0
+        async for current_hash in stream:
+            merkle.update(current_hash.encode())
+            total_entries += 1
+        
+        if not total_entries:
             raise ValueError("No logs found in specified range")
         
-        # Calculate Merkle root (simplified - hash of all hashes)
-        all_hashes = "".join([log.current_hash for log in logs])
-        merkle_root = hashlib.sha256(all_hashes.encode()).hexdigest()
+        merkle_root = merkle.hexdigest()
         
         # Create checkpoint hash
-        checkpoint_data = f"{first_log_id}|{last_log_id}|{len(logs)}|{merkle_root}"
+        checkpoint_data = f"{first_log_id}|{last_log_id}|{total_entries}|{merkle_root}"
         checkpoint_hash = hashlib.sha256(checkpoint_data.encode()).hexdigest()
         
         # Create checkpoint
         checkpoint = AuditLogCheckpoint(
             first_log_id=first_log_id,
             last_log_id=last_log_id,
-            total_entries=len(logs),
+            total_entries=total_entries,
             merkle_root=merkle_root,
             checkpoint_hash=checkpoint_hash,
         )
@@ -250,7 +283,7 @@ class AuditLogger:
         await db.commit()
         await db.refresh(checkpoint)
         
-        logger.info(f"Created checkpoint for logs {first_log_id}-{last_log_id}")
+        logger.info("Created checkpoint for logs {}-{}", first_log_id, last_log_id)
         
         return checkpoint
 
@@ -5,8 +5,8 @@ Provides async Redis connection and caching utilities.
 """
 
 import redis.asyncio as redis
-from typing import Optional, Any
-import json
+from typing import Optional, Any, Awaitable, Callable
+import orjson
 from loguru import logger
 
 from app.core.config import settings
@@ -21,7 +21,10 @@ class CacheManager:
         self.redis_client: Optional[redis.Redis] = None
     
     async def connect(self):
-        """Initialize Redis connection"""
+        """Initialize Redis connection (no-op if already connected)"""
+        if self.redis_client is not None:
+            return
+        
         try:
             self.redis_client = await redis.from_url(
                 settings.REDIS_URL,
@@ -34,13 +37,18 @@ class CacheManager:
             logger.info("Redis connection established")
             
         except Exception as e:
-            logger.error(f"Redis connection failed: {e}")
+            logger.error("Redis connection failed: {}", e)
+            # Drop the half-open client so a later connect() retries
+            if self.redis_client is not None:
+                await self.redis_client.close()
+                self.redis_client = None
             raise
     
     async def disconnect(self):
         """Close Redis connection"""
         if self.redis_client:
             await self.redis_client.close()
+            self.redis_client = None
             logger.info("Redis connection closed")
     
     async def get(self, key: str) -> Optional[Any]:
@@ -51,10 +59,10 @@ class CacheManager:
         try:
             value = await self.redis_client.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception as e:
-            logger.error(f"Cache get error: {e}")
+            logger.error("Cache get error: {}", e)
             return None
     
     async def set(
@@ -76,13 +84,40 @@ class CacheManager:
         
         try:
             ttl = ttl or settings.REDIS_TTL
-            serialized = json.dumps(value)
+            serialized = orjson.dumps(value)
             await self.redis_client.setex(key, ttl, serialized)
             return True
         except Exception as e:
-            logger.error(f"Cache set error: {e}")
+            logger.error("Cache set error: {}", e)
             return False
     
+    async def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        Get value from cache, computing and caching it on a miss
+        
+        Args:
+            key: Cache key
+            factory: Coroutine function producing the value on a miss
+            ttl: Time to live in seconds (default: settings.REDIS_TTL)
+        
+        Returns:
+            The cached or freshly computed value. None results are
+            returned but not cached.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+        
+        value = await factory()
+        if value is not None:
+            await self.set(key, value, ttl=ttl)
+        return value
+    
     async def delete(self, key: str) -> bool:
         """Delete key from cache"""
         if not self.redis_client:
@@ -92,7 +127,7 @@ class CacheManager:
             await self.redis_client.delete(key)
             return True
         except Exception as e:
-            logger.error(f"Cache delete error: {e}")
+            logger.error("Cache delete error: {}", e)
             return False
     
     async def clear_pattern(self, pattern: str) -> int:
@@ -117,7 +152,7 @@ class CacheManager:
                 return await self.redis_client.delete(*keys)
             return 0
         except Exception as e:
-            logger.error(f"Cache clear pattern error: {e}")
+            logger.error("Cache clear pattern error: {}", e)
             return 0
     
     async def exists(self, key: str) -> bool:
@@ -128,9 +163,14 @@ class CacheManager:
         try:
             return await self.redis_client.exists(key) > 0
         except Exception as e:
-            logger.error(f"Cache exists error: {e}")
+            logger.error("Cache exists error: {}", e)
             return False
 
 
 # Global cache manager instance
 cache_manager = CacheManager()
+
+
+def roles_cache_key(organization_id: Any) -> str:
+    """Key for an organization's cached role list; drop it whenever roles change"""
+    return f"roles:list:{organization_id}"
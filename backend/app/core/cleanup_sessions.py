@@ -0,0 +1,61 @@
+"""
+Onboarding Session Cleanup Script
+
+Purges expired onboarding sessions. Run periodically, e.g. from cron.
+"""
+
+from sqlalchemy import text
+from loguru import logger
+
+from app.core.database import database_manager
+from app.services.onboarding_session import OnboardingSessionManager
+
+
+# MySQL named lock so overlapping cron runs don't repeat the DELETE
+CLEANUP_LOCK_NAME = "onboarding_session_cleanup"
+
+
+async def cleanup_onboarding_sessions() -> int:
+    """
+    Purge expired onboarding sessions in a single DELETE
+
+    Returns:
+        Number of sessions deleted, or 0 if another run holds the lock
+    """
+    # Named locks belong to a connection, so hold a dedicated one for the
+    # duration of the run
+    async with database_manager.engine.connect() as lock_conn:
+        acquired = await lock_conn.scalar(
+            text("SELECT GET_LOCK(:name, 0)"), {"name": CLEANUP_LOCK_NAME}
+        )
+        if acquired != 1:
+            logger.info("Another onboarding session cleanup is running; skipping")
+            return 0
+        try:
+            async with database_manager.session_factory() as session:
+                deleted = await OnboardingSessionManager().cleanup_expired_sessions(session)
+            logger.info("Deleted {} expired onboarding sessions", deleted)
+            return deleted
+        finally:
+            await lock_conn.execute(
+                text("SELECT RELEASE_LOCK(:name)"), {"name": CLEANUP_LOCK_NAME}
+            )
+
+
+# Command-line script (run periodically, e.g. from cron):
+#   python -m app.core.cleanup_sessions
+if __name__ == "__main__":
+    import asyncio
+
+    async def run_cleanup():
+        """Run the cleanup script"""
+        await database_manager.connect()
+        try:
+            await cleanup_onboarding_sessions()
+        except Exception as e:
+            logger.error("Onboarding session cleanup failed: {}", e)
+            raise
+        finally:
+            await database_manager.disconnect()
+
+    asyncio.run(run_cleanup())
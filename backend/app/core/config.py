@@ -8,6 +8,7 @@ with type validation and defaults.
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List, Optional
 from functools import lru_cache
+from uuid import UUID
 
 
 class Settings(BaseSettings):
@@ -197,3 +198,9 @@ def get_settings() -> Settings:
 
 # Global settings instance
 settings = get_settings()
+
+# Organization used by endpoints that do not yet resolve the authenticated
+# user's organization, and by the seed script that creates it.
+# TODO: Replace every use with the authenticated user's organization (and,
+# for registration, the organization from the registration context)
+TEST_ORG_ID = UUID("00000000-0000-0000-0000-000000000001")
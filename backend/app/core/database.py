@@ -31,7 +31,10 @@ class DatabaseManager:
         self.session_factory = None
     
     async def connect(self):
-        """Initialize database connection"""
+        """Initialize database connection (no-op if already connected)"""
+        if self.engine is not None:
+            return
+
         try:
             # Create async engine
             self.engine = create_async_engine(
@@ -55,16 +58,40 @@ class DatabaseManager:
                 from sqlalchemy import text
                 await conn.execute(text("SELECT 1"))
             
+            await self._warm_pool()
+            
             logger.info("Database connection established")
             
         except Exception as e:
-            logger.error(f"Database connection failed: {e}")
+            logger.error("Database connection failed: {}", e)
+            # Drop the unverified engine so a later connect() retries
+            if self.engine is not None:
+                await self.engine.dispose()
+                self.engine = None
+                self.session_factory = None
             raise
     
+    async def _warm_pool(self):
+        """
+        Open DB_POOL_MIN connections at startup so the first requests
+        reuse pooled connections instead of paying connect latency
+        """
+        connections = []
+        try:
+            for _ in range(settings.DB_POOL_MIN):
+                connections.append(await self.engine.connect())
+        finally:
+            # Closing returns each connection to the pool rather than
+            # disconnecting it
+            for conn in connections:
+                await conn.close()
+    
     async def disconnect(self):
         """Close database connection"""
         if self.engine:
             await self.engine.dispose()
+            self.engine = None
+            self.session_factory = None
             logger.info("Database connection closed")
     
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
@@ -27,6 +27,8 @@ class PermissionCategory(str, Enum):
 
 class Permission:
     """Permission definition"""
+    __slots__ = ("name", "description", "category")
+
     def __init__(self, name: str, description: str, category: PermissionCategory):
         self.name = name
         self.description = description
@@ -162,8 +164,8 @@ def get_all_permissions() -> List[str]:
     return [p.name for p in ALL_PERMISSIONS]
 
 
-def get_permissions_by_category() -> Dict[str, List[Permission]]:
-    """Get permissions grouped by category"""
+def _group_permissions_by_category() -> Dict[str, List[Permission]]:
+    """Group ALL_PERMISSIONS by category, preserving definition order"""
     categorized = {}
     for permission in ALL_PERMISSIONS:
         category = permission.category.value
@@ -173,16 +175,37 @@ def get_permissions_by_category() -> Dict[str, List[Permission]]:
     return categorized
 
 
+# The permission taxonomy is static, so group it once at import
+PERMISSIONS_BY_CATEGORY: Dict[str, List[Permission]] = _group_permissions_by_category()
+
+
+def get_permissions_by_category() -> Dict[str, List[Permission]]:
+    """
+    Get permissions grouped by category
+
+    Returns the shared, precomputed mapping; callers must not mutate it.
+    """
+    return PERMISSIONS_BY_CATEGORY
+
+
+# Serialized once; the permission list endpoint returns it on every call
+PERMISSION_DETAILS: List[Dict[str, str]] = [
+    {
+        "name": p.name,
+        "description": p.description,
+        "category": p.category.value
+    }
+    for p in ALL_PERMISSIONS
+]
+
+
 def get_permission_details() -> List[Dict[str, str]]:
-    """Get permission details for API responses"""
-    return [
-        {
-            "name": p.name,
-            "description": p.description,
-            "category": p.category.value
-        }
-        for p in ALL_PERMISSIONS
-    ]
+    """
+    Get permission details for API responses
+
+    Returns the shared, precomputed list; callers must not mutate it.
+    """
+    return PERMISSION_DETAILS
 
 
 # ============================================
@@ -12,6 +12,7 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.backends import default_backend
 from jose import JWTError, jwt
+from starlette.concurrency import run_in_threadpool
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 import secrets
@@ -83,6 +84,34 @@ def verify_password(password: str, hashed_password: str) -> bool:
         return False
 
 
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password without blocking the event loop
+
+    Argon2 is deliberately slow and memory-hard (64 MB per hash), so
+    async request handlers run it in the thread pool instead of stalling
+    every other request on the worker.
+    """
+    return await run_in_threadpool(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """
+    Verify a password without blocking the event loop
+
+    See hash_password_async.
+    """
+    return await run_in_threadpool(verify_password, password, hashed_password)
+
+
+# Common passwords rejected outright (basic list - expand in production).
+# Built once as a frozenset for constant-time lookups as it grows.
+COMMON_PASSWORDS = frozenset({
+    'password', '12345678', 'qwerty', 'admin', 'letmein',
+    'welcome', 'monkey', 'dragon', 'master', 'password123'
+})
+
+
 def validate_password_strength(password: str) -> bool:
     """
     Validate password meets complexity requirements
@@ -126,12 +155,8 @@ def validate_password_strength(password: str) -> bool:
     if settings.PASSWORD_REQUIRE_SPECIAL and not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
         errors.append("Password must contain at least one special character")
 
-    # Check for common passwords (basic list - expand in production)
-    common_passwords = [
-        'password', '12345678', 'qwerty', 'admin', 'letmein',
-        'welcome', 'monkey', 'dragon', 'master', 'password123'
-    ]
-    if password.lower() in common_passwords:
+    # Check for common passwords
+    if password.lower() in COMMON_PASSWORDS:
         errors.append("Password is too common. Please choose a stronger password")
 
     if errors:
@@ -216,6 +241,12 @@ def decrypt_data(encrypted_data: str) -> str:
 # JWT Token Management
 # ============================================
 
+# Settings are fixed for the life of the process, so resolve the token
+# parameters once rather than on every encode/decode
+ACCESS_TOKEN_EXPIRE = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+REFRESH_TOKEN_EXPIRE = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+JWT_ALGORITHMS = [settings.ALGORITHM]
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token
@@ -228,15 +259,11 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
         Encoded JWT token string
     """
     to_encode = data.copy()
-
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    now = datetime.utcnow()
 
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + (expires_delta or ACCESS_TOKEN_EXPIRE),
+        "iat": now,
         "type": "access"
     })
 
@@ -255,11 +282,11 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
         Encoded JWT refresh token string
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    now = datetime.utcnow()
 
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + REFRESH_TOKEN_EXPIRE,
+        "iat": now,
         "type": "refresh"
     })
 
@@ -280,7 +307,7 @@ def decode_token(token: str) -> Dict[str, Any]:
     Raises:
         JWTError: If token is invalid or expired
     """
-    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=JWT_ALGORITHMS)
     return payload
 
 
@@ -8,12 +8,12 @@ input sanitization, and other security features.
 from fastapi import Request, HTTPException, status
 from fastapi.responses import Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.types import ASGIApp
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Deque, Dict, Optional
+import math
 import time
 import hashlib
 import secrets
-from collections import defaultdict
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
 import re
 import html
@@ -27,10 +27,20 @@ class RateLimiter:
     """
     In-memory rate limiter for API endpoints
 
+    Per-key state is kept in a bounded LRU so that traffic from many
+    distinct clients cannot grow the process without limit. Lockouts stay
+    in force until they expire; expired ones are swept when the LRU evicts.
+
     In production, use Redis for distributed rate limiting
     """
-    def __init__(self):
-        self.requests: Dict[str, List[float]] = defaultdict(list)
+    __slots__ = ("max_tracked_keys", "requests", "lockouts")
+
+    # Most keys tracked at once; the least recently seen are evicted first
+    MAX_TRACKED_KEYS = 10000
+
+    def __init__(self, max_tracked_keys: int = MAX_TRACKED_KEYS):
+        self.max_tracked_keys = max_tracked_keys
+        self.requests: "OrderedDict[str, Deque[float]]" = OrderedDict()
         self.lockouts: Dict[str, float] = {}
 
     def is_rate_limited(
@@ -62,26 +72,41 @@ class RateLimiter:
             else:
                 # Lockout expired
                 del self.lockouts[key]
-                self.requests[key] = []
-
-        # Clean old requests outside window
-        self.requests[key] = [
-            req_time for req_time in self.requests[key]
-            if current_time - req_time < window_seconds
-        ]
+                self.requests.pop(key, None)
+
+        window = self.requests.get(key)
+        if window is None:
+            window = self.requests[key] = deque()
+            # Evict the least recently seen keys once over capacity
+            if len(self.requests) > self.max_tracked_keys:
+                while len(self.requests) > self.max_tracked_keys:
+                    self.requests.popitem(last=False)
+                if len(self.lockouts) > self.max_tracked_keys:
+                    self._prune_lockouts(current_time)
+        else:
+            self.requests.move_to_end(key)
+
+        # Timestamps are appended in order, so expired ones are at the left
+        while window and current_time - window[0] >= window_seconds:
+            window.popleft()
 
         # Check rate limit
-        if len(self.requests[key]) >= max_requests:
+        if len(window) >= max_requests:
             # Too many requests - apply lockout
             self.lockouts[key] = current_time + lockout_seconds
             return True, f"Too many requests. Account locked for {lockout_seconds // 60} minutes"
 
         # Record this request
-        self.requests[key] = []
-        self.requests[key].append(current_time)
+        window.append(current_time)
 
         return False, None
 
+    def _prune_lockouts(self, current_time: float) -> None:
+        """Drop lockouts that have already expired"""
+        expired = [key for key, until in self.lockouts.items() if until <= current_time]
+        for key in expired:
+            del self.lockouts[key]
+
 
 # Global rate limiter instance
 rate_limiter = RateLimiter()
@@ -123,6 +148,16 @@ class CSRFProtection:
 # Input Sanitization
 # ============================================
 
+# Validation patterns, compiled once at import
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9.!#$%&\'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$')
+USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{3,32}$')
+PHONE_STRIP_PATTERN = re.compile(r'[^\d+]')
+PHONE_PATTERN = re.compile(r'^\+?[\d]{7,15}$')
+URL_SCHEMES_HTTPS_ONLY = ('https://',)
+URL_SCHEMES_WITH_HTTP = ('https://', 'http://')
+URL_PATTERN = re.compile(r'^https?://[a-zA-Z0-9.-]+(?:\.[a-zA-Z]{2,})?(?:/.*)?$')
+
+
 class InputSanitizer:
     """
     Sanitize and validate user inputs
@@ -169,7 +204,7 @@ class InputSanitizer:
         email = email.lower().strip()
 
         # Basic email validation
-        if not re.match(r'^[a-zA-Z0-9.!#$%&\'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$', email):
+        if not EMAIL_PATTERN.match(email):
             raise ValueError("Invalid email format")
 
         # Check for injection attempts
@@ -194,7 +229,7 @@ class InputSanitizer:
 
         username = username.strip()
 
-        if not re.match(r'^[a-zA-Z0-9_-]{3,32}$', username):
+        if not USERNAME_PATTERN.match(username):
             raise ValueError("Username must be 3-32 characters (letters, numbers, underscore, hyphen only)")
 
         return username
@@ -208,10 +243,10 @@ class InputSanitizer:
             raise ValueError("Phone must be a string")
 
         # Remove all non-digit characters except +
-        phone = re.sub(r'[^\d+]', '', phone)
+        phone = PHONE_STRIP_PATTERN.sub('', phone)
 
         # Basic validation
-        if not re.match(r'^\+?[\d]{7,15}$', phone):
+        if not PHONE_PATTERN.match(phone):
             raise ValueError("Invalid phone number format")
 
         return phone
@@ -233,15 +268,12 @@ class InputSanitizer:
 
         url = url.strip()
 
-        # Check protocol
-        if not url.startswith('https://'):
-            if allow_http and url.startswith('http://'):
-                pass  # Allow HTTP in development
-            else:
-                raise ValueError("URL must use HTTPS")
+        # Check protocol (HTTP is only allowed in development)
+        if not url.startswith(URL_SCHEMES_WITH_HTTP if allow_http else URL_SCHEMES_HTTPS_ONLY):
+            raise ValueError("URL must use HTTPS")
 
         # Basic URL validation
-        if not re.match(r'^https?://[a-zA-Z0-9.-]+(?:\.[a-zA-Z]{2,})?(?:/.*)?$', url):
+        if not URL_PATTERN.match(url):
             raise ValueError("Invalid URL format")
 
         return url
@@ -302,6 +334,10 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 # Rate Limiting Dependency
 # ============================================
 
+# Preflight and probe requests never reach a handler's side effects, so
+# they are neither counted nor limited
+RATE_LIMIT_EXEMPT_METHODS = frozenset({"OPTIONS", "HEAD"})
+
 async def check_rate_limit(
     request: Request,
     max_requests: int = 5,
@@ -313,6 +349,9 @@ async def check_rate_limit(
     Usage:
         @router.post("/endpoint", dependencies=[Depends(check_rate_limit)])
     """
+    if request.method in RATE_LIMIT_EXEMPT_METHODS:
+        return
+
     # Get client IP
     client_ip = request.client.host if request.client else "unknown"
 
@@ -324,9 +363,13 @@ async def check_rate_limit(
     )
 
     if is_limited:
+        # Tell well-behaved clients how long to back off instead of retrying
+        lockout_until = rate_limiter.lockouts.get(client_ip, time.time())
+        retry_after = max(1, math.ceil(lockout_until - time.time()))
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=reason or "Too many requests"
+            detail=reason or "Too many requests",
+            headers={"Retry-After": str(retry_after)}
         )
 
 
@@ -334,6 +377,9 @@ async def check_rate_limit(
 # CSRF Protection Dependency
 # ============================================
 
+# Methods that never change state and so need no CSRF token
+CSRF_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
 async def verify_csrf_token(request: Request) -> None:
     """
     Dependency to verify CSRF token
@@ -342,7 +388,7 @@ async def verify_csrf_token(request: Request) -> None:
         @router.post("/endpoint", dependencies=[Depends(verify_csrf_token)])
     """
     # Skip CSRF for GET, HEAD, OPTIONS
-    if request.method in ["GET", "HEAD", "OPTIONS"]:
+    if request.method in CSRF_SAFE_METHODS:
         return
 
     # Get token from header
@@ -479,8 +525,8 @@ def get_client_ip(request: Request) -> str:
     # Check X-Forwarded-For header (if behind proxy)
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
-        # Take first IP in list
-        return forwarded_for.split(",")[0].strip()
+        # Take first IP in list without splitting every hop
+        return forwarded_for.partition(",")[0].strip()
 
     # Fallback to direct client IP
     return request.client.host if request.client else "unknown"
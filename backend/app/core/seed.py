@@ -10,6 +10,8 @@ import uuid
 from typing import Optional
 
 from app.models.user import Organization, Role
+from app.core.cache import cache_manager, roles_cache_key
+from app.core.config import TEST_ORG_ID
 from app.core.permissions import DEFAULT_ROLES, get_admin_role_slugs
 from loguru import logger
 
@@ -32,7 +34,7 @@ async def seed_organization(db: AsyncSession, org_id: Optional[uuid.UUID] = None
         )
         existing_org = result.scalar_one_or_none()
         if existing_org:
-            logger.info(f"Organization already exists: {existing_org.name}")
+            logger.info("Organization already exists: {}", existing_org.name)
             return existing_org
 
     # Create new organization
@@ -57,7 +59,7 @@ async def seed_organization(db: AsyncSession, org_id: Optional[uuid.UUID] = None
     await db.commit()
     await db.refresh(organization)
 
-    logger.info(f"Created organization: {organization.name} ({organization.id})")
+    logger.info("Created organization: {} ({})", organization.name, organization.id)
     return organization
 
 
@@ -69,28 +71,30 @@ async def seed_roles(db: AsyncSession, organization_id: uuid.UUID):
         db: Database session
         organization_id: Organization to create roles for
     """
-    logger.info(f"Seeding roles for organization {organization_id}")
+    logger.info("Seeding roles for organization {}", organization_id)
 
-    for role_slug, role_data in DEFAULT_ROLES.items():
-        # Check if role already exists
-        result = await db.execute(
-            select(Role).where(
-                Role.organization_id == organization_id,
-                Role.slug == role_slug
-            )
+    # Load every existing default role in one query instead of one per slug
+    result = await db.execute(
+        select(Role).where(
+            Role.organization_id == organization_id,
+            Role.slug.in_(DEFAULT_ROLES.keys())
         )
-        existing_role = result.scalar_one_or_none()
+    )
+    existing_roles = {role.slug: role for role in result.scalars().all()}
+
+    new_roles = []
+    for role_slug, role_data in DEFAULT_ROLES.items():
+        existing_role = existing_roles.get(role_slug)
 
         if existing_role:
-            logger.info(f"Role already exists: {role_data['name']}")
+            logger.info("Role already exists: {}", role_data['name'])
             # Update permissions in case they changed
             existing_role.permissions = role_data['permissions']
             existing_role.priority = role_data['priority']
-            await db.commit()
             continue
 
         # Create new role
-        role = Role(
+        new_roles.append(Role(
             id=uuid.uuid4(),
             organization_id=organization_id,
             name=role_data['name'],
@@ -99,12 +103,14 @@ async def seed_roles(db: AsyncSession, organization_id: uuid.UUID):
             permissions=role_data['permissions'],
             is_system=role_data['is_system'],
             priority=role_data['priority'],
-        )
+        ))
+        logger.info("Created role: {}", role_data['name'])
 
-        db.add(role)
-        logger.info(f"Created role: {role.name}")
+    db.add_all(new_roles)
 
+    # Flush all updates and inserts together in one transaction
     await db.commit()
+    await cache_manager.delete(roles_cache_key(organization_id))
     logger.info("Roles seeded successfully")
 
 
@@ -117,11 +123,8 @@ async def seed_database(db: AsyncSession):
     """
     logger.info("Starting database seeding...")
 
-    # Use a fixed UUID for testing
-    test_org_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
-
     # Seed organization
-    organization = await seed_organization(db, test_org_id)
+    organization = await seed_organization(db, TEST_ORG_ID)
 
     # Seed roles
     await seed_roles(db, organization.id)
@@ -142,7 +145,7 @@ if __name__ == "__main__":
                 await seed_database(session)
                 break
             except Exception as e:
-                logger.error(f"Seeding failed: {e}")
+                logger.error("Seeding failed: {}", e)
                 raise
         await database_manager.disconnect()
 
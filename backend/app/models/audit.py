@@ -79,7 +79,14 @@ class AuditLog(Base):
     
     # Indexes
     __table_args__ = (
-        Index('idx_audit_timestamp', 'timestamp'),
+        # Append-only and inserted in time order: BRIN on PostgreSQL, a plain
+        # B-tree elsewhere (the postgresql_* options are ignored by MySQL)
+        Index(
+            'idx_audit_timestamp',
+            'timestamp',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        ),
         Index('idx_audit_user_id', 'user_id'),
         Index('idx_audit_event_type', 'event_type'),
         Index('idx_audit_current_hash', 'current_hash'),
@@ -160,9 +160,15 @@ class TrainingRecord(Base):
     course = relationship("TrainingCourse", back_populates="training_records")
 
     __table_args__ = (
-        Index('idx_record_user_status', 'user_id', 'status'),
         Index('idx_record_completion', 'completion_date'),
         Index('idx_record_expiration', 'expiration_date'),
+        # Organization-wide listings and reports filter on org + status and
+        # range-scan a date
+        Index('idx_record_org_status_completion', 'organization_id', 'status', 'completion_date'),
+        Index('idx_record_org_status_expiration', 'organization_id', 'status', 'expiration_date'),
+        # Requirement progress and user stats: one user's completed records
+        # within a date range; also covers (user_id, status) lookups
+        Index('idx_record_user_status_completion', 'user_id', 'status', 'completion_date'),
     )
 
     def __repr__(self):
@@ -124,6 +124,8 @@ class User(Base):
     __table_args__ = (
         Index('idx_user_org_username', 'organization_id', 'username', unique=True),
         Index('idx_user_org_email', 'organization_id', 'email', unique=True),
+        # Member roster: filter by organization, ordered by name
+        Index('idx_user_org_name', 'organization_id', 'last_name', 'first_name'),
     )
     
     @property
@@ -6,7 +6,7 @@ HIPAA compliant with comprehensive audit logging.
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, update, func, or_
 from fastapi import HTTPException, status
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, Tuple
@@ -17,8 +17,8 @@ import base64
 
 from app.models.user import User, Session, UserStatus
 from app.core.security import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
     create_access_token,
     create_refresh_token,
     decode_token,
@@ -76,28 +76,23 @@ class AuthService:
         Raises:
             ValueError: If username/email already exists
         """
-        # Check if username exists in organization
-        existing_user = await self.db.execute(
-            select(User).where(
+        # Check username and email uniqueness in organization with one
+        # query; at most one row can match each, so two rows cover both.
+        # The database decides which field matched, under its own collation
+        result = await self.db.execute(
+            select((User.username == username).label("username_taken")).where(
                 User.organization_id == organization_id,
-                User.username == username
-            )
+                or_(User.username == username, User.email == email)
+            ).limit(2)
         )
-        if existing_user.scalar_one_or_none():
+        conflicts = result.all()
+        if any(row.username_taken for row in conflicts):
             raise ValueError("Username already exists")
-
-        # Check if email exists in organization
-        existing_email = await self.db.execute(
-            select(User).where(
-                User.organization_id == organization_id,
-                User.email == email
-            )
-        )
-        if existing_email.scalar_one_or_none():
+        if conflicts:
             raise ValueError("Email already exists")
 
         # Hash password
-        password_hash = hash_password(password)
+        password_hash = await hash_password_async(password)
 
         # Create user
         user = User(
@@ -209,13 +204,28 @@ class AuthService:
             raise AuthenticationError("Account is not active")
 
         # Verify password
-        if not verify_password(password, user.password_hash):
-            # Increment failed login attempts
-            user.failed_login_attempts += 1
+        if not await verify_password_async(password, user.password_hash):
+            # Increment failed login attempts in the database so concurrent
+            # failures cannot overwrite each other's count
+            await self.db.execute(
+                update(User)
+                .where(User.id == user.id)
+                .values(failed_login_attempts=func.coalesce(User.failed_login_attempts, 0) + 1)
+                .execution_options(synchronize_session=False)
+            )
 
             # Lock account after 5 failed attempts
-            if user.failed_login_attempts >= 5:
-                user.locked_until = datetime.utcnow() + timedelta(minutes=30)
+            result = await self.db.execute(
+                update(User)
+                .where(User.id == user.id, User.failed_login_attempts >= 5)
+                .values(locked_until=datetime.utcnow() + timedelta(minutes=30))
+                .execution_options(synchronize_session=False)
+            )
+
+            # Pick up the stored count for the audit trail
+            await self.db.refresh(user, attribute_names=["failed_login_attempts", "locked_until"])
+
+            if result.rowcount:
                 await log_audit_event(
                     db=self.db,
                     event_type="auth.account_locked_auto",
@@ -523,15 +533,15 @@ class AuthService:
             ValueError: If current password is wrong or new password is invalid
         """
         # Verify current password
-        if not verify_password(current_password, user.password_hash):
+        if not await verify_password_async(current_password, user.password_hash):
             raise ValueError("Current password is incorrect")
 
         # Check if new password is different
-        if verify_password(new_password, user.password_hash):
+        if await verify_password_async(new_password, user.password_hash):
             raise ValueError("New password must be different from current password")
 
         # Hash new password (validation happens in hash_password)
-        new_hash = hash_password(new_password)
+        new_hash = await hash_password_async(new_password)
 
         # Update password
         user.password_hash = new_hash
@@ -6,15 +6,15 @@ Business logic for authentication operations.
 
 from typing import Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func, or_
 from sqlalchemy.orm import selectinload
 from datetime import datetime, timedelta
 from uuid import UUID, uuid4
 
 from app.models.user import User, Session as UserSession, Organization
 from app.core.security import (
-    verify_password,
-    get_password_hash,
+    verify_password_async,
+    hash_password_async,
     create_access_token,
     create_refresh_token,
     decode_token,
@@ -57,30 +57,41 @@ class AuthService:
         user = result.scalar_one_or_none()
 
         if not user:
-            logger.warning(f"Authentication failed: user not found - {username}")
+            logger.warning("Authentication failed: user not found - {}", username)
             return None
 
         if not user.password_hash:
-            logger.warning(f"Authentication failed: no password set - {username}")
+            logger.warning("Authentication failed: no password set - {}", username)
             return None
 
         # Check if account is locked
         if user.locked_until and user.locked_until > datetime.utcnow():
-            logger.warning(f"Authentication failed: account locked - {username}")
+            logger.warning("Authentication failed: account locked - {}", username)
             return None
 
         # Verify password
-        if not verify_password(password, user.password_hash):
-            # Increment failed login attempts
-            user.failed_login_attempts = (user.failed_login_attempts or 0) + 1
+        if not await verify_password_async(password, user.password_hash):
+            # Increment failed login attempts in the database so concurrent
+            # failures cannot overwrite each other's count
+            await self.db.execute(
+                update(User)
+                .where(User.id == user.id)
+                .values(failed_login_attempts=func.coalesce(User.failed_login_attempts, 0) + 1)
+                .execution_options(synchronize_session=False)
+            )
 
             # Lock account after 5 failed attempts
-            if user.failed_login_attempts >= 5:
-                user.locked_until = datetime.utcnow() + timedelta(minutes=30)
-                logger.warning(f"Account locked due to failed attempts - {username}")
+            result = await self.db.execute(
+                update(User)
+                .where(User.id == user.id, User.failed_login_attempts >= 5)
+                .values(locked_until=datetime.utcnow() + timedelta(minutes=30))
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                logger.warning("Account locked due to failed attempts - {}", username)
 
             await self.db.commit()
-            logger.warning(f"Authentication failed: invalid password - {username}")
+            logger.warning("Authentication failed: invalid password - {}", username)
             return None
 
         # Reset failed login attempts on successful login
@@ -135,7 +146,7 @@ class AuthService:
         self.db.add(session)
         await self.db.commit()
 
-        logger.info(f"Created session for user: {user.username}")
+        logger.info("Created session for user: {}", user.username)
 
         return access_token, refresh_token
 
@@ -194,7 +205,7 @@ class AuthService:
             return new_access_token
 
         except Exception as e:
-            logger.error(f"Token refresh failed: {e}")
+            logger.error("Token refresh failed: {}", e)
             return None
 
     async def register_user(
@@ -227,26 +238,20 @@ class AuthService:
         if not is_valid:
             return None, error_msg
 
-        # Check if username exists
+        # Check username and email uniqueness with one query; at most one
+        # row can match each, so two rows cover both. The database decides
+        # which field matched, under its own collation
         result = await self.db.execute(
-            select(User).where(
-                User.username == username,
+            select((User.username == username).label("username_taken")).where(
+                or_(User.username == username, User.email == email),
                 User.organization_id == organization_id,
                 User.deleted_at.is_(None)
-            )
+            ).limit(2)
         )
-        if result.scalar_one_or_none():
+        conflicts = result.all()
+        if any(row.username_taken for row in conflicts):
             return None, "Username already exists"
-
-        # Check if email exists
-        result = await self.db.execute(
-            select(User).where(
-                User.email == email,
-                User.organization_id == organization_id,
-                User.deleted_at.is_(None)
-            )
-        )
-        if result.scalar_one_or_none():
+        if conflicts:
             return None, "Email already exists"
 
         # Create user
@@ -255,7 +260,7 @@ class AuthService:
             organization_id=organization_id,
             username=username,
             email=email,
-            password_hash=get_password_hash(password),
+            password_hash=await hash_password_async(password),
             first_name=first_name,
             last_name=last_name,
             badge_number=badge_number,
@@ -267,7 +272,7 @@ class AuthService:
         await self.db.commit()
         await self.db.refresh(user)
 
-        logger.info(f"User registered: {username}")
+        logger.info("User registered: {}", username)
 
         return user, None
 
@@ -290,13 +295,13 @@ class AuthService:
             if session:
                 await self.db.delete(session)
                 await self.db.commit()
-                logger.info(f"User logged out: session {session.id}")
+                logger.info("User logged out: session {}", session.id)
                 return True
 
             return False
 
         except Exception as e:
-            logger.error(f"Logout failed: {e}")
+            logger.error("Logout failed: {}", e)
             return False
 
     async def change_password(
@@ -317,7 +322,7 @@ class AuthService:
             Tuple of (success, error_message)
         """
         # Verify current password
-        if not user.password_hash or not verify_password(current_password, user.password_hash):
+        if not user.password_hash or not await verify_password_async(current_password, user.password_hash):
             return False, "Current password is incorrect"
 
         # Validate new password
@@ -326,12 +331,12 @@ class AuthService:
             return False, error_msg
 
         # Update password
-        user.password_hash = get_password_hash(new_password)
+        user.password_hash = await hash_password_async(new_password)
         user.password_changed_at = datetime.utcnow()
 
         await self.db.commit()
 
-        logger.info(f"Password changed for user: {user.username}")
+        logger.info("Password changed for user: {}", user.username)
 
         return True, None
 
@@ -364,5 +369,5 @@ class AuthService:
             return user if user and user.is_active else None
 
         except Exception as e:
-            logger.error(f"Token validation failed: {e}")
+            logger.error("Token validation failed: {}", e)
             return None
@@ -6,16 +6,19 @@ This module guides users through initial setup and can be disabled once complete
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert
+from sqlalchemy.orm import defer
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import secrets
 import os
+import time
 
 from app.models.onboarding import OnboardingStatus, OnboardingChecklistItem
 from app.models.user import Organization, User, Role, UserStatus
 from app.services.auth import AuthService
 from app.core.config import settings
+from app.core.cache import cache_manager, roles_cache_key
 from app.core.audit import log_audit_event
 
 
@@ -70,8 +73,198 @@ class OnboardingService:
         }
     ]
 
+    # Modules that can be enabled during onboarding
+    AVAILABLE_MODULES = (
+        "training", "compliance", "scheduling", "inventory",
+        "meetings", "elections", "fundraising", "incidents",
+        "equipment", "vehicles", "budget"
+    )
+    _AVAILABLE_MODULE_SET = frozenset(AVAILABLE_MODULES)
+
+    # System roles created for every new organization
+    DEFAULT_ROLES = [
+        {
+            "name": "Super Administrator",
+            "slug": "super_admin",
+            "description": "Full system access and management",
+            "permissions": ["*"],  # All permissions
+            "is_system": True,
+            "priority": 100
+        },
+        {
+            "name": "Administrator",
+            "slug": "admin",
+            "description": "Organization management and user administration",
+            "permissions": [
+                "users.*", "roles.*", "settings.*", "modules.*",
+                "documents.*", "calendar.*", "communications.*"
+            ],
+            "is_system": True,
+            "priority": 90
+        },
+        {
+            "name": "Chief",
+            "slug": "chief",
+            "description": "Department chief with full operational access",
+            "permissions": [
+                "users.view", "users.edit",
+                "documents.*", "calendar.*", "training.*",
+                "inventory.*", "incidents.*", "reports.view"
+            ],
+            "is_system": True,
+            "priority": 80
+        },
+        {
+            "name": "Officer",
+            "slug": "officer",
+            "description": "Officer with elevated permissions",
+            "permissions": [
+                "users.view", "documents.*", "calendar.*",
+                "training.view", "training.edit", "inventory.view",
+                "incidents.*"
+            ],
+            "is_system": True,
+            "priority": 70
+        },
+        {
+            "name": "Member",
+            "slug": "member",
+            "description": "Regular member with standard access",
+            "permissions": [
+                "users.view_own", "documents.view", "calendar.view",
+                "training.view_own", "communications.view"
+            ],
+            "is_system": True,
+            "priority": 50
+        },
+        {
+            "name": "Probationary",
+            "slug": "probationary",
+            "description": "Probationary member with limited access",
+            "permissions": [
+                "users.view_own", "documents.view_public",
+                "calendar.view", "communications.view"
+            ],
+            "is_system": True,
+            "priority": 30
+        }
+    ]
+
+    # Follow-up tasks created once onboarding completes
+    POST_ONBOARDING_CHECKLIST = [
+        {
+            "title": "Set up TLS/HTTPS certificates",
+            "description": "Enable HTTPS for secure communication",
+            "category": "security",
+            "priority": "critical",
+            "documentation_link": "https://docs.the-logbook.org/security/tls",
+            "estimated_time_minutes": 60,
+            "sort_order": 1
+        },
+        {
+            "title": "Configure email notifications",
+            "description": "Set up SMTP for email notifications",
+            "category": "configuration",
+            "priority": "high",
+            "documentation_link": "https://docs.the-logbook.org/configuration/email",
+            "estimated_time_minutes": 30,
+            "sort_order": 2
+        },
+        {
+            "title": "Set up automated backups",
+            "description": "Configure regular database backups",
+            "category": "deployment",
+            "priority": "critical",
+            "documentation_link": "https://docs.the-logbook.org/deployment/backups",
+            "estimated_time_minutes": 45,
+            "sort_order": 3
+        },
+        {
+            "title": "Review HIPAA compliance checklist",
+            "description": "Complete HIPAA compliance requirements",
+            "category": "security",
+            "priority": "critical",
+            "documentation_link": "SECURITY.md#hipaa-compliance-checklist",
+            "estimated_time_minutes": 120,
+            "sort_order": 4
+        },
+        {
+            "title": "Enable multi-factor authentication",
+            "description": "Require MFA for all administrative users",
+            "category": "security",
+            "priority": "high",
+            "documentation_link": "SECURITY.md#authentication--authorization",
+            "estimated_time_minutes": 15,
+            "sort_order": 5
+        },
+        {
+            "title": "Configure firewall rules",
+            "description": "Set up network security and firewall",
+            "category": "security",
+            "priority": "critical",
+            "documentation_link": "https://docs.the-logbook.org/security/firewall",
+            "estimated_time_minutes": 90,
+            "sort_order": 6
+        },
+        {
+            "title": "Set up monitoring and alerting",
+            "description": "Configure system monitoring and alerts",
+            "category": "deployment",
+            "priority": "high",
+            "documentation_link": "https://docs.the-logbook.org/deployment/monitoring",
+            "estimated_time_minutes": 60,
+            "sort_order": 7
+        },
+        {
+            "title": "Train staff on security policies",
+            "description": "Conduct security awareness training",
+            "category": "security",
+            "priority": "high",
+            "documentation_link": "SECURITY.md",
+            "estimated_time_minutes": 180,
+            "sort_order": 8
+        },
+        {
+            "title": "Test disaster recovery plan",
+            "description": "Verify backup restoration procedures",
+            "category": "deployment",
+            "priority": "high",
+            "documentation_link": "https://docs.the-logbook.org/deployment/disaster-recovery",
+            "estimated_time_minutes": 120,
+            "sort_order": 9
+        },
+        {
+            "title": "Review and customize user roles",
+            "description": "Adjust role permissions for your organization",
+            "category": "configuration",
+            "priority": "medium",
+            "documentation_link": "https://docs.the-logbook.org/configuration/roles",
+            "estimated_time_minutes": 45,
+            "sort_order": 10
+        }
+    ]
+
+    # Onboarding normally only moves from pending to completed, so a
+    # completed answer is reused process-wide for a short TTL; the TTL (and
+    # reset_completion_cache) covers database resets and reseeds
+    COMPLETED_CACHE_TTL = 60
+    _completed_until = 0.0
+
     def __init__(self, db: AsyncSession):
         self.db = db
+        # The service is built per request; several steps read the status
+        # more than once, so keep the loaded row for the request
+        self._status: Optional[OnboardingStatus] = None
+
+    @classmethod
+    def _remember_completed(cls) -> None:
+        """Cache a completed answer for COMPLETED_CACHE_TTL seconds"""
+        cls._completed_until = time.monotonic() + cls.COMPLETED_CACHE_TTL
+
+    @classmethod
+    def reset_completion_cache(cls) -> None:
+        """Forget a cached completed answer, e.g. after a database reset"""
+        cls._completed_until = 0.0
 
     async def needs_onboarding(self) -> bool:
         """
@@ -80,23 +273,30 @@ class OnboardingService:
         Returns:
             True if onboarding is needed, False if already completed
         """
-        # Check if onboarding status exists
+        if time.monotonic() < OnboardingService._completed_until:
+            return False
+
+        # Check for a completed onboarding status and for any existing
+        # organization in a single round trip
         result = await self.db.execute(
-            select(OnboardingStatus).where(OnboardingStatus.is_completed == True)
+            select(
+                select(OnboardingStatus.id)
+                .where(OnboardingStatus.is_completed == True)
+                .exists(),
+                select(Organization.id).exists(),
+            )
         )
-        completed = result.scalar_one_or_none()
+        completed, org_exists = result.one()
 
         if completed:
+            self._remember_completed()
             return False
 
-        # Also check if any organizations exist
-        result = await self.db.execute(select(func.count(Organization.id)))
-        org_count = result.scalar()
-
         # If organizations exist, assume onboarding was done (legacy)
-        if org_count > 0:
+        if org_exists:
             # Auto-mark as completed
             await self._mark_legacy_completed()
+            self._remember_completed()
             return False
 
         return True
@@ -108,10 +308,22 @@ class OnboardingService:
         Returns:
             OnboardingStatus object or None if not started
         """
+        if self._status is not None:
+            return self._status
+
+        # The setup notes and user agent are write-only here;
+        # leave them out of the row fetched by every onboarding request
         result = await self.db.execute(
-            select(OnboardingStatus).order_by(OnboardingStatus.created_at.desc()).limit(1)
+            select(OnboardingStatus)
+            .options(
+                defer(OnboardingStatus.setup_notes),
+                defer(OnboardingStatus.setup_user_agent),
+            )
+            .order_by(OnboardingStatus.created_at.desc())
+            .limit(1)
         )
-        return result.scalar_one_or_none()
+        self._status = result.scalar_one_or_none()
+        return self._status
 
     async def start_onboarding(
         self,
@@ -145,6 +357,7 @@ class OnboardingService:
         await self.db.commit()
         await self.db.refresh(status)
 
+        self._status = status
         return status
 
     async def verify_security_configuration(self) -> Dict[str, Any]:
@@ -292,82 +505,17 @@ class OnboardingService:
 
     async def _create_default_roles(self, organization_id: str):
         """Create default roles for an organization"""
-        default_roles = [
-            {
-                "name": "Super Administrator",
-                "slug": "super_admin",
-                "description": "Full system access and management",
-                "permissions": ["*"],  # All permissions
-                "is_system": True,
-                "priority": 100
-            },
-            {
-                "name": "Administrator",
-                "slug": "admin",
-                "description": "Organization management and user administration",
-                "permissions": [
-                    "users.*", "roles.*", "settings.*", "modules.*",
-                    "documents.*", "calendar.*", "communications.*"
-                ],
-                "is_system": True,
-                "priority": 90
-            },
-            {
-                "name": "Chief",
-                "slug": "chief",
-                "description": "Department chief with full operational access",
-                "permissions": [
-                    "users.view", "users.edit",
-                    "documents.*", "calendar.*", "training.*",
-                    "inventory.*", "incidents.*", "reports.view"
-                ],
-                "is_system": True,
-                "priority": 80
-            },
-            {
-                "name": "Officer",
-                "slug": "officer",
-                "description": "Officer with elevated permissions",
-                "permissions": [
-                    "users.view", "documents.*", "calendar.*",
-                    "training.view", "training.edit", "inventory.view",
-                    "incidents.*"
-                ],
-                "is_system": True,
-                "priority": 70
-            },
-            {
-                "name": "Member",
-                "slug": "member",
-                "description": "Regular member with standard access",
-                "permissions": [
-                    "users.view_own", "documents.view", "calendar.view",
-                    "training.view_own", "communications.view"
-                ],
-                "is_system": True,
-                "priority": 50
-            },
-            {
-                "name": "Probationary",
-                "slug": "probationary",
-                "description": "Probationary member with limited access",
-                "permissions": [
-                    "users.view_own", "documents.view_public",
-                    "calendar.view", "communications.view"
-                ],
-                "is_system": True,
-                "priority": 30
-            }
-        ]
-
-        for role_data in default_roles:
-            role = Role(
-                organization_id=organization_id,
-                **role_data
-            )
-            self.db.add(role)
-
+        # Single bulk INSERT for all default roles
+        await self.db.execute(
+            insert(Role),
+            [
+                {"organization_id": organization_id, **role_data}
+                for role_data in self.DEFAULT_ROLES
+            ]
+        )
         await self.db.commit()
+        # The bulk INSERT bypasses the roles endpoints, so drop their cache here
+        await cache_manager.delete(roles_cache_key(organization_id))
 
     async def create_admin_user(
         self,
@@ -417,6 +565,9 @@ class OnboardingService:
         super_admin_role = result.scalar_one_or_none()
 
         if super_admin_role:
+            # Load the (empty) roles collection up front; a lazy load on
+            # append is not possible under AsyncSession
+            await self.db.refresh(user, attribute_names=["roles"])
             user.roles.append(super_admin_role)
             await self.db.commit()
 
@@ -456,15 +607,8 @@ class OnboardingService:
         Returns:
             Dictionary of module name to enabled status
         """
-        # Define available modules
-        available_modules = [
-            "training", "compliance", "scheduling", "inventory",
-            "meetings", "elections", "fundraising", "incidents",
-            "equipment", "vehicles", "budget"
-        ]
-
         # Validate modules
-        invalid_modules = [m for m in enabled_modules if m not in available_modules]
+        invalid_modules = [m for m in enabled_modules if m not in self._AVAILABLE_MODULE_SET]
         if invalid_modules:
             raise ValueError(f"Invalid modules: {', '.join(invalid_modules)}")
 
@@ -474,7 +618,8 @@ class OnboardingService:
             status.enabled_modules = enabled_modules
             await self._mark_step_completed(status, 5, "modules")
 
-        return {module: module in enabled_modules for module in available_modules}
+        enabled = set(enabled_modules)
+        return {module: module in enabled for module in self.AVAILABLE_MODULES}
 
     async def verify_database_connection(self) -> Dict[str, Any]:
         """
@@ -484,15 +629,16 @@ class OnboardingService:
             Dictionary with connection status
         """
         try:
-            # Test query
-            result = await self.db.execute(select(func.now()))
-            db_time = result.scalar()
-
-            # Check table existence
+            # Test query and table existence check in a single round trip
             result = await self.db.execute(
-                select(func.count()).select_from(Organization)
+                select(
+                    func.now(),
+                    select(func.count())
+                    .select_from(Organization)
+                    .scalar_subquery(),
+                )
             )
-            org_count = result.scalar()
+            db_time, org_count = result.one()
 
             return {
                 "connected": True,
@@ -545,6 +691,7 @@ class OnboardingService:
         status.setup_notes = notes
 
         await self.db.commit()
+        self._remember_completed()
 
         # Create post-onboarding checklist
         await self._create_post_onboarding_checklist()
@@ -592,106 +739,14 @@ class OnboardingService:
         )
         self.db.add(status)
         await self.db.commit()
+        self._status = status
 
     async def _create_post_onboarding_checklist(self):
         """Create post-onboarding checklist items"""
-        checklist_items = [
-            {
-                "title": "Set up TLS/HTTPS certificates",
-                "description": "Enable HTTPS for secure communication",
-                "category": "security",
-                "priority": "critical",
-                "documentation_link": "https://docs.the-logbook.org/security/tls",
-                "estimated_time_minutes": 60,
-                "sort_order": 1
-            },
-            {
-                "title": "Configure email notifications",
-                "description": "Set up SMTP for email notifications",
-                "category": "configuration",
-                "priority": "high",
-                "documentation_link": "https://docs.the-logbook.org/configuration/email",
-                "estimated_time_minutes": 30,
-                "sort_order": 2
-            },
-            {
-                "title": "Set up automated backups",
-                "description": "Configure regular database backups",
-                "category": "deployment",
-                "priority": "critical",
-                "documentation_link": "https://docs.the-logbook.org/deployment/backups",
-                "estimated_time_minutes": 45,
-                "sort_order": 3
-            },
-            {
-                "title": "Review HIPAA compliance checklist",
-                "description": "Complete HIPAA compliance requirements",
-                "category": "security",
-                "priority": "critical",
-                "documentation_link": "SECURITY.md#hipaa-compliance-checklist",
-                "estimated_time_minutes": 120,
-                "sort_order": 4
-            },
-            {
-                "title": "Enable multi-factor authentication",
-                "description": "Require MFA for all administrative users",
-                "category": "security",
-                "priority": "high",
-                "documentation_link": "SECURITY.md#authentication--authorization",
-                "estimated_time_minutes": 15,
-                "sort_order": 5
-            },
-            {
-                "title": "Configure firewall rules",
-                "description": "Set up network security and firewall",
-                "category": "security",
-                "priority": "critical",
-                "documentation_link": "https://docs.the-logbook.org/security/firewall",
-                "estimated_time_minutes": 90,
-                "sort_order": 6
-            },
-            {
-                "title": "Set up monitoring and alerting",
-                "description": "Configure system monitoring and alerts",
-                "category": "deployment",
-                "priority": "high",
-                "documentation_link": "https://docs.the-logbook.org/deployment/monitoring",
-                "estimated_time_minutes": 60,
-                "sort_order": 7
-            },
-            {
-                "title": "Train staff on security policies",
-                "description": "Conduct security awareness training",
-                "category": "security",
-                "priority": "high",
-                "documentation_link": "SECURITY.md",
-                "estimated_time_minutes": 180,
-                "sort_order": 8
-            },
-            {
-                "title": "Test disaster recovery plan",
-                "description": "Verify backup restoration procedures",
-                "category": "deployment",
-                "priority": "high",
-                "documentation_link": "https://docs.the-logbook.org/deployment/disaster-recovery",
-                "estimated_time_minutes": 120,
-                "sort_order": 9
-            },
-            {
-                "title": "Review and customize user roles",
-                "description": "Adjust role permissions for your organization",
-                "category": "configuration",
-                "priority": "medium",
-                "documentation_link": "https://docs.the-logbook.org/configuration/roles",
-                "estimated_time_minutes": 45,
-                "sort_order": 10
-            }
-        ]
-
-        for item_data in checklist_items:
-            item = OnboardingChecklistItem(**item_data)
-            self.db.add(item)
-
+        # Single bulk INSERT; no need to build and track ORM instances
+        await self.db.execute(
+            insert(OnboardingChecklistItem), self.POST_ONBOARDING_CHECKLIST
+        )
         await self.db.commit()
 
     async def get_post_onboarding_checklist(self) -> List[OnboardingChecklistItem]:
@@ -48,6 +48,13 @@ class OnboardingSessionManager:
         session_id = self.generate_session_id()
         expires_at = datetime.utcnow() + self.SESSION_TIMEOUT
 
+        # Purge expired sessions in one statement; reads never delete
+        await db.execute(
+            delete(OnboardingSessionModel).where(
+                OnboardingSessionModel.expires_at < datetime.utcnow()
+            )
+        )
+
         session = OnboardingSessionModel(
             session_id=session_id,
             data={},
@@ -74,23 +81,11 @@ class OnboardingSessionManager:
         Returns:
             Session data dict or None if not found/expired
         """
-        result = await db.execute(
-            select(OnboardingSessionModel).where(
-                OnboardingSessionModel.session_id == session_id
-            )
-        )
-        session = result.scalar_one_or_none()
+        session = await self._get_active_session(db, session_id)
 
         if not session:
             return None
 
-        # Check if expired
-        if session.expires_at < datetime.utcnow():
-            # Delete expired session
-            await db.delete(session)
-            await db.commit()
-            return None
-
         return session.data
 
     async def update_session(
@@ -111,22 +106,11 @@ class OnboardingSessionManager:
         Returns:
             True if successful, False if session not found
         """
-        result = await db.execute(
-            select(OnboardingSessionModel).where(
-                OnboardingSessionModel.session_id == session_id
-            )
-        )
-        session = result.scalar_one_or_none()
+        session = await self._get_active_session(db, session_id)
 
         if not session:
             return False
 
-        # Check if expired
-        if session.expires_at < datetime.utcnow():
-            await db.delete(session)
-            await db.commit()
-            return False
-
         # Update data
         if merge:
             session.data = {**session.data, **data}
@@ -138,6 +122,26 @@ class OnboardingSessionManager:
         await db.commit()
         return True
 
+    async def _get_active_session(
+        self,
+        db: AsyncSession,
+        session_id: str
+    ) -> Optional[OnboardingSessionModel]:
+        """
+        Get a session that has not expired
+
+        Expired sessions are filtered out in the query rather than deleted
+        on read; they are purged in bulk by cleanup_expired_sessions and
+        when a new session is created.
+        """
+        result = await db.execute(
+            select(OnboardingSessionModel).where(
+                OnboardingSessionModel.session_id == session_id,
+                OnboardingSessionModel.expires_at >= datetime.utcnow()
+            )
+        )
+        return result.scalar_one_or_none()
+
     async def delete_session(
         self,
         db: AsyncSession,
@@ -278,37 +282,3 @@ class OnboardingSessionManager:
 
         return True
 
-
-# ============================================
-# Database Model
-# ============================================
-
-"""
-Add this model to app/models/onboarding.py:
-
-from sqlalchemy import Column, String, JSON, DateTime, Text
-from sqlalchemy.ext.mutable import MutableDict
-from app.core.database import Base
-from app.core.utils import generate_uuid
-
-class OnboardingSessionModel(Base):
-    '''
-    Server-side onboarding session storage
-
-    SECURITY: Stores sensitive onboarding data encrypted server-side
-    instead of in browser sessionStorage
-    '''
-    __tablename__ = "onboarding_sessions"
-
-    id = Column(String(36), primary_key=True, default=generate_uuid)
-    session_id = Column(String(64), unique=True, nullable=False, index=True)
-    data = Column(MutableDict.as_mutable(JSON), default={}, nullable=False)
-    ip_address = Column(String(45), nullable=False)
-    user_agent = Column(Text, nullable=True)
-    expires_at = Column(DateTime, nullable=False, index=True)
-    created_at = Column(DateTime, nullable=False)
-    updated_at = Column(DateTime, nullable=False)
-
-    def __repr__(self):
-        return f"<OnboardingSession(id={self.id}, session_id={self.session_id[:8]}...)>"
-"""
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from uuid import UUID
 
+from app.core.cache import cache_manager
 from app.models.user import Organization
 from app.schemas.organization import OrganizationSettings, ContactInfoSettings
 
@@ -16,8 +17,14 @@ from app.schemas.organization import OrganizationSettings, ContactInfoSettings
 class OrganizationService:
     """Service for organization-related business logic"""
 
+    # Settings are read on every member list request but change rarely
+    SETTINGS_CACHE_TTL = 300
+
     def __init__(self, db: AsyncSession):
         self.db = db
+        # Services are built per request, so this memoizes settings for
+        # the lifetime of a single request
+        self._settings: Dict[UUID, OrganizationSettings] = {}
 
     async def get_organization(self, organization_id: UUID) -> Optional[Organization]:
         """Get an organization by ID"""
@@ -34,28 +41,29 @@ class OrganizationService:
         Get organization settings
 
         Returns a parsed OrganizationSettings object with defaults if not set.
+        Parsed settings are cached in Redis and refreshed on update.
         """
-        org = await self.get_organization(organization_id)
-        if not org:
+        if organization_id in self._settings:
+            return self._settings[organization_id]
+
+        async def load_settings() -> Optional[Dict[str, Any]]:
+            org = await self.get_organization(organization_id)
+            if not org:
+                return None
+            return self._parse_settings(org.settings or {}).model_dump(mode="json")
+
+        cached = await cache_manager.get_or_set(
+            self._settings_cache_key(organization_id),
+            load_settings,
+            ttl=self.SETTINGS_CACHE_TTL,
+        )
+        if cached is None:
             # Return default settings if org not found
             return OrganizationSettings()
 
-        # Get settings from JSONB field, or use defaults
-        settings_dict = org.settings or {}
-
-        # Parse contact info visibility settings
-        contact_info = settings_dict.get("contact_info_visibility", {})
-        contact_settings = ContactInfoSettings(
-            enabled=contact_info.get("enabled", False),
-            show_email=contact_info.get("show_email", True),
-            show_phone=contact_info.get("show_phone", True),
-            show_mobile=contact_info.get("show_mobile", True),
-        )
-
-        return OrganizationSettings(
-            contact_info_visibility=contact_settings,
-            **{k: v for k, v in settings_dict.items() if k != "contact_info_visibility"}
-        )
+        org_settings = OrganizationSettings.model_validate(cached)
+        self._settings[organization_id] = org_settings
+        return org_settings
 
     async def update_organization_settings(
         self,
@@ -85,10 +93,49 @@ class OrganizationService:
         # Update in database
         org.settings = updated_settings
         await self.db.commit()
-        await self.db.refresh(org)
 
-        # Return updated settings
-        return await self.get_organization_settings(organization_id)
+        # Build the result from the merged dict already in hand and replace
+        # the cached copy, rather than reloading the organization
+        return await self._store_settings(organization_id, updated_settings)
+
+    async def _store_settings(
+        self,
+        organization_id: UUID,
+        settings_dict: Optional[Dict[str, Any]]
+    ) -> OrganizationSettings:
+        """Parse a raw settings dict and cache it in Redis and on the instance"""
+        org_settings = self._parse_settings(settings_dict or {})
+
+        await cache_manager.set(
+            self._settings_cache_key(organization_id),
+            org_settings.model_dump(mode="json"),
+            ttl=self.SETTINGS_CACHE_TTL,
+        )
+        self._settings[organization_id] = org_settings
+
+        return org_settings
+
+    @staticmethod
+    def _parse_settings(settings_dict: Dict[str, Any]) -> OrganizationSettings:
+        """Parse the JSON settings column, filling in defaults"""
+        # Parse contact info visibility settings
+        contact_info = settings_dict.get("contact_info_visibility", {})
+        contact_settings = ContactInfoSettings(
+            enabled=contact_info.get("enabled", False),
+            show_email=contact_info.get("show_email", True),
+            show_phone=contact_info.get("show_phone", True),
+            show_mobile=contact_info.get("show_mobile", True),
+        )
+
+        return OrganizationSettings(
+            contact_info_visibility=contact_settings,
+            **{k: v for k, v in settings_dict.items() if k != "contact_info_visibility"}
+        )
+
+    @staticmethod
+    def _settings_cache_key(organization_id: UUID) -> str:
+        """Cache key for an organization's parsed settings"""
+        return f"org:{organization_id}:settings"
 
     def check_contact_info_enabled(self, settings: OrganizationSettings) -> bool:
         """Check if contact information display is enabled"""
@@ -7,8 +7,7 @@ Business logic for training management including courses, records, requirements,
 from typing import List, Optional, Dict, Tuple
 from datetime import datetime, date, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, and_, or_, case
 from uuid import UUID
 
 from app.models.training import (
@@ -18,7 +17,7 @@ from app.models.training import (
     TrainingStatus,
     TrainingType,
 )
-from app.models.user import User
+from app.models.user import User, user_roles
 from app.schemas.training import (
     UserTrainingStats,
     TrainingHoursSummary,
@@ -39,63 +38,69 @@ class TrainingService:
         """
         Get comprehensive training statistics for a user
         """
-        current_year = datetime.now().year
-
-        # Get all completed training records
-        result = await self.db.execute(
-            select(TrainingRecord)
-            .where(TrainingRecord.user_id == user_id)
-            .where(TrainingRecord.organization_id == organization_id)
-            .where(TrainingRecord.status == TrainingStatus.COMPLETED)
-        )
-        records = result.scalars().all()
-
-        # Calculate total hours
-        total_hours = sum(r.hours_completed for r in records)
-
-        # Calculate this year's hours
-        hours_this_year = sum(
-            r.hours_completed
-            for r in records
-            if r.completion_date and r.completion_date.year == current_year
-        )
-
-        # Count certifications
-        certifications = [r for r in records if r.certification_number]
-        total_certifications = len(certifications)
-
-        # Count active, expiring soon, and expired
         today = date.today()
+        year_start = date(today.year, 1, 1)
+        year_end = date(today.year, 12, 31)
         ninety_days = today + timedelta(days=90)
 
-        active_certifications = sum(
-            1
-            for r in certifications
-            if r.expiration_date and r.expiration_date > today
+        is_certification = and_(
+            TrainingRecord.certification_number.isnot(None),
+            TrainingRecord.certification_number != "",
         )
 
-        expiring_soon = sum(
-            1
-            for r in certifications
-            if r.expiration_date
-            and today < r.expiration_date <= ninety_days
-        )
-
-        expired = sum(
-            1
-            for r in certifications
-            if r.expiration_date and r.expiration_date <= today
+        # Aggregate everything in the database in one pass over the user's
+        # completed records instead of materializing them in Python
+        result = await self.db.execute(
+            select(
+                func.count(TrainingRecord.id).label("completed_courses"),
+                func.coalesce(func.sum(TrainingRecord.hours_completed), 0).label("total_hours"),
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (
+                                TrainingRecord.completion_date.between(year_start, year_end),
+                                TrainingRecord.hours_completed,
+                            ),
+                            else_=0,
+                        )
+                    ),
+                    0,
+                ).label("hours_this_year"),
+                func.count(case((is_certification, 1))).label("total_certifications"),
+                func.count(
+                    case((and_(is_certification, TrainingRecord.expiration_date > today), 1))
+                ).label("active_certifications"),
+                func.count(
+                    case(
+                        (
+                            and_(
+                                is_certification,
+                                TrainingRecord.expiration_date > today,
+                                TrainingRecord.expiration_date <= ninety_days,
+                            ),
+                            1,
+                        )
+                    )
+                ).label("expiring_soon"),
+                func.count(
+                    case((and_(is_certification, TrainingRecord.expiration_date <= today), 1))
+                ).label("expired"),
+            )
+            .where(TrainingRecord.user_id == user_id)
+            .where(TrainingRecord.organization_id == organization_id)
+            .where(TrainingRecord.status == TrainingStatus.COMPLETED)
         )
+        stats = result.one()
 
         return UserTrainingStats(
             user_id=user_id,
-            total_hours=total_hours,
-            hours_this_year=hours_this_year,
-            total_certifications=total_certifications,
-            active_certifications=active_certifications,
-            expiring_soon=expiring_soon,
-            expired=expired,
-            completed_courses=len(records),
+            total_hours=float(stats.total_hours),
+            hours_this_year=float(stats.hours_this_year),
+            total_certifications=stats.total_certifications,
+            active_certifications=stats.active_certifications,
+            expiring_soon=stats.expiring_soon,
+            expired=stats.expired,
+            completed_courses=stats.completed_courses,
         )
 
     async def get_training_hours_by_type(
@@ -189,14 +194,14 @@ class TrainingService:
             )
             requirements = req_result.scalars().all()
 
-            for req in requirements:
-                progress = await self.check_requirement_progress(
-                    user_id, req.id, organization_id
-                )
+            progress_list = await self.get_bulk_requirements_progress(
+                user_id, organization_id, requirements
+            )
+            for progress in progress_list:
                 if progress.is_complete:
-                    requirements_met.append(req.id)
+                    requirements_met.append(progress.requirement_id)
                 else:
-                    requirements_pending.append(req.id)
+                    requirements_pending.append(progress.requirement_id)
 
         return TrainingReport(
             user_id=user_id,
@@ -226,15 +231,7 @@ class TrainingService:
         if not requirement:
             raise ValueError("Requirement not found")
 
-        # Determine date range based on frequency
-        today = date.today()
-        if requirement.frequency == "annual":
-            start_date = date(requirement.year, 1, 1) if requirement.year else date(today.year, 1, 1)
-            end_date = date(requirement.year, 12, 31) if requirement.year else date(today.year, 12, 31)
-        else:
-            # For other frequencies, use requirement dates or default to current year
-            start_date = requirement.start_date or date(today.year, 1, 1)
-            end_date = requirement.due_date or today
+        start_date, end_date = self._requirement_date_range(requirement)
 
         # Get completed hours in the date range
         query = (
@@ -257,7 +254,90 @@ class TrainingService:
         result = await self.db.execute(query)
         completed_hours = float(result.scalar() or 0)
 
-        # Calculate progress
+        return self._build_requirement_progress(requirement, completed_hours)
+
+    async def get_bulk_requirements_progress(
+        self,
+        user_id: UUID,
+        organization_id: UUID,
+        requirements: List[TrainingRequirement],
+    ) -> List[RequirementProgress]:
+        """
+        Check a user's progress towards several requirements at once
+
+        Loads the user's completed records covering every requirement's
+        date range in a single query and totals hours per requirement in
+        Python, instead of one SUM query per requirement.
+        """
+        if not requirements:
+            return []
+
+        today = date.today()
+        date_ranges = [self._requirement_date_range(req, today) for req in requirements]
+        earliest = min(start for start, _ in date_ranges)
+        latest = max(end for _, end in date_ranges)
+
+        result = await self.db.execute(
+            select(
+                TrainingRecord.hours_completed,
+                TrainingRecord.completion_date,
+                TrainingRecord.training_type,
+                TrainingRecord.course_id,
+            )
+            .where(TrainingRecord.user_id == user_id)
+            .where(TrainingRecord.organization_id == organization_id)
+            .where(TrainingRecord.status == TrainingStatus.COMPLETED)
+            .where(TrainingRecord.completion_date >= earliest)
+            .where(TrainingRecord.completion_date <= latest)
+        )
+        records = result.all()
+
+        progress_list = []
+        for req, (start_date, end_date) in zip(requirements, date_ranges):
+            required_courses = (
+                {str(course_id) for course_id in req.required_courses}
+                if req.required_courses
+                else None
+            )
+            completed_hours = float(
+                sum(
+                    record.hours_completed or 0
+                    for record in records
+                    if start_date <= record.completion_date <= end_date
+                    and (not req.training_type or record.training_type == req.training_type)
+                    and (
+                        required_courses is None
+                        or str(record.course_id) in required_courses
+                    )
+                )
+            )
+            progress_list.append(
+                self._build_requirement_progress(req, completed_hours)
+            )
+
+        return progress_list
+
+    @staticmethod
+    def _requirement_date_range(
+        requirement: TrainingRequirement, today: Optional[date] = None
+    ) -> Tuple[date, date]:
+        """Determine the date range a requirement is measured over"""
+        today = today or date.today()
+        if requirement.frequency == "annual":
+            start_date = date(requirement.year, 1, 1) if requirement.year else date(today.year, 1, 1)
+            end_date = date(requirement.year, 12, 31) if requirement.year else date(today.year, 12, 31)
+        else:
+            # For other frequencies, use requirement dates or default to current year
+            start_date = requirement.start_date or date(today.year, 1, 1)
+            end_date = requirement.due_date or today
+
+        return start_date, end_date
+
+    @staticmethod
+    def _build_requirement_progress(
+        requirement: TrainingRequirement, completed_hours: float
+    ) -> RequirementProgress:
+        """Calculate progress towards a requirement from completed hours"""
         required_hours = requirement.required_hours or 0
         percentage = (completed_hours / required_hours * 100) if required_hours > 0 else 100
         is_complete = completed_hours >= required_hours
@@ -280,17 +360,19 @@ class TrainingService:
         """
         current_year = year or datetime.now().year
 
-        # Get user's roles
+        # Get the user's role ids straight from the association table in
+        # one query; the outer join still yields a row for users with no
+        # roles, so an empty result means the user does not exist
         user_result = await self.db.execute(
-            select(User)
+            select(User.id, user_roles.c.role_id)
+            .outerjoin(user_roles, user_roles.c.user_id == User.id)
             .where(User.id == user_id)
-            .options(selectinload(User.roles))
         )
-        user = user_result.scalar_one_or_none()
-        if not user:
+        rows = user_result.all()
+        if not rows:
             return []
 
-        user_role_ids = [str(role.id) for role in user.roles]
+        user_role_ids = {str(row.role_id) for row in rows if row.role_id is not None}
 
         # Get all active requirements
         query = (
@@ -320,15 +402,10 @@ class TrainingService:
                 if any(role_id in user_role_ids for role_id in req.required_roles):
                     applicable_requirements.append(req)
 
-        # Get progress for each requirement
-        progress_list = []
-        for req in applicable_requirements:
-            progress = await self.check_requirement_progress(
-                user_id, req.id, organization_id
-            )
-            progress_list.append(progress)
-
-        return progress_list
+        # Get progress for all applicable requirements in one pass
+        return await self.get_bulk_requirements_progress(
+            user_id, organization_id, applicable_requirements
+        )
 
     async def get_expiring_certifications(
         self, organization_id: UUID, days_ahead: int = 90
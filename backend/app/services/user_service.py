@@ -7,7 +7,7 @@ Business logic for user-related operations.
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 from uuid import UUID
 
 from app.models.user import User, Organization
@@ -24,7 +24,9 @@ class UserService:
         self,
         organization_id: UUID,
         include_contact_info: bool = False,
-        contact_settings: Optional[Dict[str, Any]] = None
+        contact_settings: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
     ) -> List[UserListResponse]:
         """
         Get all users for an organization
@@ -33,18 +35,57 @@ class UserService:
             organization_id: The organization ID
             include_contact_info: Whether to include contact information
             contact_settings: Settings dict controlling which contact fields to show
+            skip: Number of users to skip, in name order
+            limit: Maximum number of users to return (all when None)
 
         Returns:
             List of UserListResponse objects with contact info conditionally included
         """
-        # Query users with roles
-        result = await self.db.execute(
+        # Resolve which contact fields are visible once, not per user
+        visibility = (
+            contact_settings.get("contact_info_visibility", {})
+            if include_contact_info and contact_settings
+            else {}
+        )
+        show_email = visibility.get("show_email", False)
+        show_phone = visibility.get("show_phone", False)
+        show_mobile = visibility.get("show_mobile", False)
+
+        # Load only the columns the list response uses; contact columns
+        # are fetched only when they will be shown
+        columns = [
+            User.id,
+            User.organization_id,
+            User.username,
+            User.first_name,
+            User.last_name,
+            User.badge_number,
+            User.photo_url,
+            User.status,
+            User.hire_date,
+        ]
+        if show_email:
+            columns.append(User.email)
+        if show_phone:
+            columns.append(User.phone)
+        if show_mobile:
+            columns.append(User.mobile)
+
+        # Query users; the list response carries no roles, so don't
+        # eager-load them (that was a second query over every user)
+        query = (
             select(User)
+            .options(load_only(*columns))
             .where(User.organization_id == organization_id)
             .where(User.deleted_at.is_(None))
-            .options(selectinload(User.roles))
             .order_by(User.last_name, User.first_name)
         )
+        if skip:
+            query = query.offset(skip)
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = await self.db.execute(query)
         users = result.scalars().all()
 
         # Convert to response schema
@@ -64,22 +105,9 @@ class UserService:
             }
 
             # Conditionally include contact information based on settings
-            if include_contact_info and contact_settings:
-                visibility = contact_settings.get("contact_info_visibility", {})
-
-                if visibility.get("show_email", False):
-                    user_dict["email"] = user.email
-
-                if visibility.get("show_phone", False):
-                    user_dict["phone"] = user.phone
-
-                if visibility.get("show_mobile", False):
-                    user_dict["mobile"] = user.mobile
-            else:
-                # Don't include contact info if not enabled
-                user_dict["email"] = None
-                user_dict["phone"] = None
-                user_dict["mobile"] = None
+            user_dict["email"] = user.email if show_email else None
+            user_dict["phone"] = user.phone if show_phone else None
+            user_dict["mobile"] = user.mobile if show_mobile else None
 
             user_responses.append(UserListResponse(**user_dict))
 
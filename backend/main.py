@@ -7,10 +7,12 @@ connects to the database, and configures routes.
 """
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from loguru import logger
+import orjson
 import sys
 
 from app.core.config import settings
@@ -41,8 +43,8 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("🚀 Starting The Logbook Backend...")
-    logger.info(f"Environment: {settings.ENVIRONMENT}")
-    logger.info(f"Version: {settings.VERSION}")
+    logger.info("Environment: {}", settings.ENVIRONMENT)
+    logger.info("Version: {}", settings.VERSION)
     
     # Connect to database
     logger.info("Connecting to database...")
@@ -54,9 +56,9 @@ async def lifespan(app: FastAPI):
     await cache_manager.connect()
     logger.info("✓ Redis connected")
     
-    logger.info(f"✓ Server started on port {settings.PORT}")
-    logger.info(f"📚 API Documentation: http://localhost:{settings.PORT}/docs")
-    logger.info(f"🔒 Health Check: http://localhost:{settings.PORT}/health")
+    logger.info("✓ Server started on port {}", settings.PORT)
+    logger.info("📚 API Documentation: http://localhost:{}/docs", settings.PORT)
+    logger.info("🔒 Health Check: http://localhost:{}/health", settings.PORT)
     
     yield
     
@@ -76,6 +78,7 @@ app = FastAPI(
     redoc_url="/redoc" if settings.ENABLE_DOCS else None,
     openapi_url="/openapi.json" if settings.ENABLE_DOCS else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # ============================================
@@ -108,25 +111,32 @@ app.add_middleware(GZipMiddleware, minimum_size=1000)
 app.include_router(api_router, prefix="/api/v1")
 
 
+# Health and root payloads depend only on settings, so serialize them once
+# with the same encoder as ORJSONResponse
+HEALTH_RESPONSE_BODY = orjson.dumps({
+    "status": "healthy",
+    "version": settings.VERSION,
+    "environment": settings.ENVIRONMENT,
+})
+
+ROOT_RESPONSE_BODY = orjson.dumps({
+    "message": "The Logbook API",
+    "version": settings.VERSION,
+    "docs": "/docs" if settings.ENABLE_DOCS else "Documentation disabled",
+})
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "version": settings.VERSION,
-        "environment": settings.ENVIRONMENT,
-    }
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "The Logbook API",
-        "version": settings.VERSION,
-        "docs": f"/docs" if settings.ENABLE_DOCS else "Documentation disabled",
-    }
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+"""
+Tests for the in-memory RateLimiter
+"""
+
+import pytest
+
+from app.core import security_middleware
+from app.core.security_middleware import RateLimiter
+
+
+class FakeClock:
+    """Controllable replacement for time.time"""
+
+    def __init__(self, start: float = 1_000_000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(security_middleware.time, "time", fake)
+    return fake
+
+
+def test_requests_within_limit_are_allowed(clock):
+    limiter = RateLimiter()
+    for _ in range(5):
+        assert limiter.is_rate_limited("1.2.3.4") == (False, None)
+        clock.advance(1)
+
+
+def test_exceeding_limit_locks_out_until_expiry(clock):
+    limiter = RateLimiter()
+    for _ in range(5):
+        assert not limiter.is_rate_limited("1.2.3.4")[0]
+
+    # Sixth request inside the 60s window trips a 30 minute lockout
+    is_limited, reason = limiter.is_rate_limited("1.2.3.4")
+    assert is_limited
+    assert "locked for 30 minutes" in reason
+
+    # Still locked just before the lockout ends, even outside the window
+    clock.advance(1800 - 1)
+    is_limited, reason = limiter.is_rate_limited("1.2.3.4")
+    assert is_limited
+    assert reason.startswith("Account locked")
+
+    # Once expired, the key starts over with a fresh window
+    clock.advance(1)
+    assert limiter.is_rate_limited("1.2.3.4") == (False, None)
+    assert "1.2.3.4" not in limiter.lockouts
+
+
+def test_requests_outside_window_are_not_counted(clock):
+    limiter = RateLimiter()
+    for _ in range(5):
+        assert not limiter.is_rate_limited("1.2.3.4")[0]
+    clock.advance(60)
+    assert not limiter.is_rate_limited("1.2.3.4")[0]
+
+
+def test_keys_are_limited_independently(clock):
+    limiter = RateLimiter()
+    for _ in range(6):
+        limiter.is_rate_limited("1.2.3.4")
+    assert limiter.is_rate_limited("1.2.3.4")[0]
+    assert not limiter.is_rate_limited("5.6.7.8")[0]
+
+
+def test_tracked_keys_are_bounded(clock):
+    limiter = RateLimiter(max_tracked_keys=3)
+    for i in range(10):
+        limiter.is_rate_limited(f"10.0.0.{i}")
+    assert list(limiter.requests) == ["10.0.0.7", "10.0.0.8", "10.0.0.9"]
+
+
+def test_expired_lockouts_are_pruned_on_eviction(clock):
+    limiter = RateLimiter(max_tracked_keys=2)
+    for key in ("a", "b", "c"):
+        for _ in range(6):
+            limiter.is_rate_limited(key)
+    assert set(limiter.lockouts) == {"a", "b", "c"}
+
+    clock.advance(1800)
+    limiter.is_rate_limited("d")
+    assert limiter.lockouts == {}